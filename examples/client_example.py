@@ -11,24 +11,172 @@ This script shows how to:
 6. Log events
 7. Query available events
 8. Get team member information
+9. Export an experiment pulse report
 
 Before running this example:
 1. Set your STATSIG_CONSOLE_API_KEY environment variable
 2. Make sure the Statsig MCP server is available
+
+Pass --in-process to call the server's tools directly in this process
+instead of spawning it as a stdio subprocess.
 """
 
 import asyncio
+import io
 import os
+import sys
+
+from mcp import ClientSession, StdioServerParameters, types
+
+from statsig_mcp import (
+    InProcessSession,
+    MCPServerPool,
+    load_cached_tools,
+    pool,
+    save_cached_tools,
+    tool_cache_key,
+)
+
+
+class StatsigMCPSession:
+    """A long-lived MCP session against the Statsig MCP server.
+
+    The underlying stdio session comes from an ``MCPServerPool`` (the
+    process-wide pool by default), so the server subprocess is spawned and
+    the MCP handshake performed once per process no matter how many
+    ``StatsigMCPSession`` objects use it.
+    """
+
+    def __init__(
+        self, server_params: StdioServerParameters, server_pool: MCPServerPool = pool
+    ) -> None:
+        self._server_params = server_params
+        self._pool = server_pool
+        self._client: ClientSession | None = None
+        self._tools = None
+
+    async def connect(self) -> None:
+        """Attach to the pooled session, starting the server if needed."""
+        if self._client is None:
+            self._client = await self._pool.get_session(self._server_params)
+
+    async def list_tools(self):
+        """Return the server's tool catalog.
+
+        The catalog is fetched at most once per session and persisted on disk,
+        keyed by the server launch parameters and server source, so warm runs
+        skip the ``tools/list`` round trip entirely.
+        """
+        if self._tools is not None:
+            return self._tools
+
+        params = self._server_params
+        cache_key = tool_cache_key(params.command, params.args, params.env)
+        cached = load_cached_tools(cache_key)
+        if cached is not None:
+            self._tools = [types.Tool.model_validate(tool) for tool in cached]
+            return self._tools
+
+        if self._client is None:
+            raise RuntimeError("Session not connected. Call connect() first.")
+
+        self._tools = (await self._client.list_tools()).tools
+        save_cached_tools(
+            cache_key, [tool.model_dump(mode="json") for tool in self._tools]
+        )
+        return self._tools
+
+    async def call_tool(self, name: str, arguments: dict | None = None):
+        """Call a tool over the persistent session."""
+        if self._client is None:
+            raise RuntimeError("Session not connected. Call connect() first.")
+
+        return await self._client.call_tool(name, arguments=arguments)
+
+    async def call_tools_batch(self, calls: list[tuple[str, dict]]) -> list:
+        """Call several tools in one round, returning results in call order.
+
+        Failed calls are returned as exceptions rather than raised. The MCP
+        stdio transport frames a single JSON-RPC message per line (batch
+        arrays were dropped from the spec), so the requests are pipelined
+        concurrently on the session and matched back up by request id.
+        """
+        return await asyncio.gather(
+            *(self.call_tool(name, arguments) for name, arguments in calls),
+            return_exceptions=True,
+        )
+
+    async def aclose(self) -> None:
+        """Detach from the pooled session; the pool owns the subprocess."""
+        self._client = None
+        self._tools = None
+
+    async def __aenter__(self) -> "StatsigMCPSession":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class _CircuitOpen(Exception):
+    """Raised to skip the remaining examples after repeated failures."""
+
+
+class _FailureGuard:
+    """Track consecutive call failures and trip after ``limit`` in a row.
+
+    A bad API key or an unreachable server makes every call fail the same
+    way, so there is no point paying for the rest of them.
+    """
+
+    def __init__(self, limit: int = 2) -> None:
+        self._limit = limit
+        self._failures = 0
+
+    def record(self, failed: bool) -> None:
+        """Record a call outcome, raising ``_CircuitOpen`` once tripped."""
+        if not failed:
+            self._failures = 0
+            return
+        self._failures += 1
+        if self._failures >= self._limit:
+            raise _CircuitOpen
+
 
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+def _failed(result) -> bool:
+    """Whether a tool call failed, including failures reported as content.
 
+    ``call_tool`` only raises for transport problems; the server reports
+    API errors as an ``isError`` result or as text starting with ``❌``.
+    """
+    if isinstance(result, BaseException):
+        return True
+    if result.isError:
+        return True
+    content = result.content
+    return bool(content) and getattr(content[0], "text", "").startswith("❌")
 
-async def run_example():
-    """Run the Statsig MCP client example."""
+
+def _write_content(out: io.StringIO, result) -> None:
+    """Append a tool result's text content to ``out`` in one write."""
+    out.write("".join(f"   {content.text}\n" for content in result.content))
+
+
+async def run_example(in_process: bool = False):
+    """Run the Statsig MCP client example.
+
+    With ``in_process=True`` the tools are called directly inside this
+    process instead of over a ``python -m statsig_mcp`` stdio subprocess.
+    """
     
+    # Read the environment once
+    env = os.environ
+    api_key = env.get("STATSIG_CONSOLE_API_KEY")
+    environment = env.get("STATSIG_ENVIRONMENT", "development")
+
     # Check if the API key is set
-    if not os.getenv("STATSIG_CONSOLE_API_KEY"):
+    if not api_key:
         print("❌ Please set STATSIG_CONSOLE_API_KEY environment variable")
         print("   Get your Console API key from: https://console.statsig.com → Project Settings → Keys & Environments")
         return
@@ -38,148 +186,136 @@ async def run_example():
         command="python",
         args=["-m", "statsig_mcp"],
         env={
-            "STATSIG_CONSOLE_API_KEY": os.getenv("STATSIG_CONSOLE_API_KEY"),
-            "STATSIG_ENVIRONMENT": os.getenv("STATSIG_ENVIRONMENT", "development"),
+            "STATSIG_CONSOLE_API_KEY": api_key,
+            "STATSIG_ENVIRONMENT": environment,
             "STATSIG_DEBUG": "true"  # Enable debug for this example
         }
     )
 
     print("🚀 Starting Statsig MCP client example...")
     
-    async with stdio_client(server_params) as (read, write):
-        async with ClientSession(read, write) as session:
-            # Initialize the session
-            print("📡 Initializing MCP session...")
-            await session.initialize()
-            
-            # List available tools
-            print("\n🔧 Available tools:")
-            tools = await session.list_tools()
-            for tool in tools:
-                print(f"  - {tool.name}: {tool.description}")
-            
-            print("\n" + "="*60)
-            print("🧪 Running Statsig examples...")
-            print("="*60)
-            
-            # Example user for testing
-            example_user = {
-                "user_id": "example_user_123",
-                "user_email": "user@example.com", 
-                "user_country": "US",
-                "custom_attributes": {
-                    "plan": "premium",
-                    "cohort": "2024_q1"
-                }
+    if in_process:
+        session = InProcessSession(api_key=api_key)
+    else:
+        session = StatsigMCPSession(server_params)
+    try:
+        # Spawn the server (or set up the in-process client) once
+        print("📡 Initializing MCP session...")
+        await session.connect()
+        
+        # List available tools
+        print("\n🔧 Available tools:")
+        for tool in await session.list_tools():
+            print(f"  - {tool.name}: {tool.description}")
+        
+        # The examples section is assembled in memory and written once
+        out = io.StringIO()
+        out.write("\n" + "="*60 + "\n")
+        out.write("🧪 Running Statsig examples...\n")
+        out.write("="*60 + "\n")
+        
+        # Example user for testing
+        example_user = {
+            "user_id": "example_user_123",
+            "user_email": "user@example.com", 
+            "user_country": "US",
+            "custom_attributes": {
+                "plan": "premium",
+                "cohort": "2024_q1"
             }
-            
-            # 1. Check a feature gate
-            print("\n1️⃣ Checking feature gate...")
-            try:
-                gate_result = await session.call_tool(
+        }
+        
+        # Per-call arguments, built up front so the batch dispatch below
+        # does no dict merging
+        gate_args = example_user | {"gate_name": "new_checkout_flow"}
+        config_args = example_user | {"config_name": "ui_settings"}
+        experiment_args = example_user | {"experiment_name": "homepage_redesign"}
+        layer_args = example_user | {"layer_name": "personalization_layer"}
+        event_args = example_user | {
+            "event_name": "mcp_example_completed",
+            "value": "success",
+            "metadata": {
+                "source": "python_example",
+                "version": "1.0.0"
+            }
+        }
+        
+        # Stop early if calls keep failing (e.g. a bad API key)
+        guard = _FailureGuard()
+        try:
+            # 1-5. The gate/config/experiment/layer/event calls are independent,
+            # so dispatch them concurrently over the shared session
+            out.write("\n1️⃣-5️⃣ Checking gate, config, experiment, layer and logging an event...\n")
+            calls = [
+                (
+                    "Feature gate result",
+                    "checking feature gate",
                     "check_feature_gate",
-                    arguments={
-                        **example_user,
-                        "gate_name": "new_checkout_flow"
-                    }
-                )
-                print("✅ Feature gate result:")
-                for content in gate_result:
-                    print(f"   {content.text}")
-            except Exception as e:
-                print(f"❌ Error checking feature gate: {e}")
-            
-            # 2. Get dynamic config  
-            print("\n2️⃣ Getting dynamic config...")
-            try:
-                config_result = await session.call_tool(
+                    gate_args,
+                ),
+                (
+                    "Dynamic config result",
+                    "getting dynamic config",
                     "get_dynamic_config",
-                    arguments={
-                        **example_user,
-                        "config_name": "ui_settings"
-                    }
-                )
-                print("✅ Dynamic config result:")
-                for content in config_result:
-                    print(f"   {content.text}")
-            except Exception as e:
-                print(f"❌ Error getting dynamic config: {e}")
-            
-            # 3. Get experiment assignment
-            print("\n3️⃣ Getting experiment assignment...")
-            try:
-                experiment_result = await session.call_tool(
+                    config_args,
+                ),
+                (
+                    "Experiment result",
+                    "getting experiment",
                     "get_experiment",
-                    arguments={
-                        **example_user,
-                        "experiment_name": "homepage_redesign"
-                    }
-                )
-                print("✅ Experiment result:")
-                for content in experiment_result:
-                    print(f"   {content.text}")
-            except Exception as e:
-                print(f"❌ Error getting experiment: {e}")
-            
-            # 4. Get layer values
-            print("\n4️⃣ Getting layer values...")
-            try:
-                layer_result = await session.call_tool(
-                    "get_layer", 
-                    arguments={
-                        **example_user,
-                        "layer_name": "personalization_layer"
-                    }
-                )
-                print("✅ Layer result:")
-                for content in layer_result:
-                    print(f"   {content.text}")
-            except Exception as e:
-                print(f"❌ Error getting layer: {e}")
-            
-            # 5. Log an event
-            print("\n5️⃣ Logging an event...")
-            try:
-                event_result = await session.call_tool(
+                    experiment_args,
+                ),
+                (
+                    "Layer result",
+                    "getting layer",
+                    "get_layer",
+                    layer_args,
+                ),
+                (
+                    "Event logging result",
+                    "logging event",
                     "log_event",
-                    arguments={
-                        **example_user,
-                        "event_name": "mcp_example_completed",
-                        "value": "success",
-                        "metadata": {
-                            "source": "python_example",
-                            "version": "1.0.0"
-                        }
-                    }
-                )
-                print("✅ Event logging result:")
-                for content in event_result:
-                    print(f"   {content.text}")
-            except Exception as e:
-                print(f"❌ Error logging event: {e}")
-            
+                    event_args,
+                ),
+            ]
+            results = await session.call_tools_batch(
+                [(name, arguments) for _, _, name, arguments in calls]
+            )
+            for (label, action, _, _), result in zip(calls, results):
+                if isinstance(result, Exception):
+                    out.write(f"❌ Error {action}: {result}\n")
+                else:
+                    out.write(f"✅ {label}:\n")
+                    _write_content(out, result)
+            # Only once every batch result is written, so tripping skips
+            # just the calls that haven't been made
+            for result in results:
+                guard.record(_failed(result))
+        
             # 6. Query available events
-            print("\n6️⃣ Querying available events...")
+            out.write("\n6️⃣ Querying available events...\n")
             try:
                 events_result = await session.call_tool("query_events")
-                print("✅ Available events:")
-                for content in events_result:
-                    print(f"   {content.text}")
+                out.write("✅ Available events:\n")
+                _write_content(out, events_result)
+                guard.record(_failed(events_result))
             except Exception as e:
-                print(f"❌ Error querying events: {e}")
-            
+                out.write(f"❌ Error querying events: {e}\n")
+                guard.record(True)
+        
             # 7. List team users  
-            print("\n7️⃣ Listing team users...")
+            out.write("\n7️⃣ Listing team users...\n")
             try:
                 users_result = await session.call_tool("list_team_users")
-                print("✅ Team users:")
-                for content in users_result:
-                    print(f"   {content.text}")
+                out.write("✅ Team users:\n")
+                _write_content(out, users_result)
+                guard.record(_failed(users_result))
             except Exception as e:
-                print(f"❌ Error listing team users: {e}")
-            
+                out.write(f"❌ Error listing team users: {e}\n")
+                guard.record(True)
+        
             # 8. Get specific user by email (using first team member's email if available)
-            print("\n8️⃣ Getting user by email...")
+            out.write("\n8️⃣ Getting user by email...\n")
             try:
                 # For demonstration, we'll use a sample email
                 # In real usage, you'd use an actual team member's email
@@ -187,16 +323,45 @@ async def run_example():
                     "get_user_by_email",
                     arguments={"email": "admin@example.com"}
                 )
-                print("✅ User details:")
-                for content in user_result:
-                    print(f"   {content.text}")
+                out.write("✅ User details:\n")
+                _write_content(out, user_result)
+                guard.record(_failed(user_result))
             except Exception as e:
-                print(f"❌ Error getting user by email: {e}")
-            
-            print("\n" + "="*60)
-            print("🎉 Statsig MCP example completed!")
-            print("="*60)
+                out.write(f"❌ Error getting user by email: {e}\n")
+                guard.record(True)
+        
+            # 9. Export a pulse report
+            out.write("\n9️⃣ Exporting pulse report...\n")
+            try:
+                report_result = await session.call_tool(
+                    "export_pulse_report",
+                    arguments={"experiment_id": "homepage_redesign", "format": "summary"},
+                )
+                out.write("✅ Pulse report:\n")
+                _write_content(out, report_result)
+                guard.record(_failed(report_result))
+            except Exception as e:
+                out.write(f"❌ Error exporting pulse report: {e}\n")
+                guard.record(True)
+        
+        except _CircuitOpen:
+            out.write("\n⏭️ Too many consecutive failures, skipping the remaining examples.\n")
+        
+        out.write("\n" + "="*60 + "\n")
+        out.write("🎉 Statsig MCP example completed!\n")
+        out.write("="*60 + "\n")
+        sys.stdout.write(out.getvalue())
+    finally:
+        await session.aclose()
+
+
+async def main():
+    """Run the example, then stop any pooled server subprocesses."""
+    try:
+        await run_example(in_process="--in-process" in sys.argv[1:])
+    finally:
+        await pool.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(run_example()) 
\ No newline at end of file
+    asyncio.run(main()) 
@@ -4,4 +4,17 @@ Statsig MCP Server
 A Model Context Protocol server for Statsig feature flags and experimentation.
 """
 
+from ._inprocess import InProcessSession
+from ._pool import MCPServerPool, pool
+from ._tool_cache import load_cached_tools, save_cached_tools, tool_cache_key
+
 __version__ = "1.0.0"
+
+__all__ = [
+    "InProcessSession",
+    "MCPServerPool",
+    "load_cached_tools",
+    "pool",
+    "save_cached_tools",
+    "tool_cache_key",
+]
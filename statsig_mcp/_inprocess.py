@@ -0,0 +1,78 @@
+"""
+In-process access to the Statsig MCP server's tools.
+
+``InProcessSession`` mirrors the parts of ``mcp.ClientSession`` used by the
+examples, but dispatches straight to the tool functions registered in
+``statsig_mcp.server`` instead of spawning ``python -m statsig_mcp`` and
+talking JSON-RPC over stdio. Real MCP clients should keep using the stdio
+transport; this is meant for scripts and tests running in the same process.
+"""
+
+import asyncio
+import os
+from typing import Any
+
+from mcp import types
+
+from . import server
+
+
+class InProcessSession:
+    """Call the server's tools directly from Python."""
+
+    def __init__(self, api_key: str | None = None) -> None:
+        self._api_key = api_key
+        self._connected = False
+
+    async def connect(self) -> None:
+        """Initialize the server's Statsig client (idempotent)."""
+        if self._connected:
+            return
+
+        api_key = self._api_key or os.getenv("STATSIG_CONSOLE_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "Statsig Console API key is required. "
+                "Pass api_key or set the STATSIG_CONSOLE_API_KEY environment variable."
+            )
+
+        await server.initialize_client({"api_key": api_key})
+        self._connected = True
+
+    async def list_tools(self) -> list[types.Tool]:
+        """Return the server's tool catalog."""
+        return types.ListToolsResult(tools=await server.list_tools()).tools
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any] | None = None
+    ) -> types.CallToolResult:
+        """Call a tool and wrap its output like ``ClientSession.call_tool``."""
+        if not self._connected:
+            raise RuntimeError("Session not connected. Call connect() first.")
+
+        content = await server.call_tool(name, arguments or {})
+        if isinstance(content, types.CallToolResult):
+            return content
+        return types.CallToolResult(content=content)
+
+    async def call_tools_batch(
+        self, calls: list[tuple[str, dict[str, Any]]]
+    ) -> list[types.CallToolResult | BaseException]:
+        """Call several tools concurrently, returning results in call order."""
+        return await asyncio.gather(
+            *(self.call_tool(name, arguments) for name, arguments in calls),
+            return_exceptions=True,
+        )
+
+    async def aclose(self) -> None:
+        """Shut down the server's Statsig client."""
+        if self._connected:
+            await server.cleanup()
+            self._connected = False
+
+    async def __aenter__(self) -> "InProcessSession":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
@@ -0,0 +1,73 @@
+"""
+Process-wide pool of stdio MCP sessions.
+
+Spawning an MCP server and performing the initialize handshake costs far
+more than a tool call, so scripts that talk to the same server from several
+places should share one session. ``MCPServerPool`` keeps one initialized
+``ClientSession`` per distinct server launch configuration.
+"""
+
+import asyncio
+from contextlib import AsyncExitStack
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+_Signature = tuple[str, tuple[str, ...], tuple[tuple[str, str], ...]]
+
+
+def _signature(params: StdioServerParameters) -> _Signature:
+    """Identify a server by its command line and environment."""
+    return (
+        params.command,
+        tuple(params.args),
+        tuple(sorted((params.env or {}).items())),
+    )
+
+
+class MCPServerPool:
+    """Share one stdio ``ClientSession`` per server for the life of the pool.
+
+    Sessions are opened lazily by ``get_session`` and all closed by
+    ``aclose``. The stdio transports run in task groups owned by the task
+    that opened them, so ``aclose`` must be awaited from that same task
+    (typically the script's top-level coroutine).
+    """
+
+    def __init__(self) -> None:
+        self._stack = AsyncExitStack()
+        self._sessions: dict[_Signature, ClientSession] = {}
+        self._locks: dict[_Signature, asyncio.Lock] = {}
+
+    async def get_session(self, params: StdioServerParameters) -> ClientSession:
+        """Return the initialized session for ``params``, starting it on first use."""
+        key = _signature(params)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+
+        # One lock per server so concurrent first callers spawn it only once
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            session = self._sessions.get(key)
+            if session is None:
+                read, write = await self._stack.enter_async_context(
+                    stdio_client(params)
+                )
+                session = await self._stack.enter_async_context(
+                    ClientSession(read, write)
+                )
+                await session.initialize()
+                self._sessions[key] = session
+        return session
+
+    async def aclose(self) -> None:
+        """Close every pooled session and stop the server subprocesses."""
+        self._sessions.clear()
+        self._locks.clear()
+        await self._stack.aclose()
+        self._stack = AsyncExitStack()
+
+
+# Shared by everything in the process that talks to a stdio MCP server
+pool = MCPServerPool()
@@ -0,0 +1,153 @@
+"""
+Buffered stdio transport for the MCP server.
+
+A drop-in replacement for ``mcp.server.stdio.stdio_server``. The stock
+transport hands every stdin line, and every stdout write and flush, to a
+worker thread. This one reads stdin in large chunks on a dedicated thread
+and passes all the messages in a chunk to the event loop in one wake-up,
+and writes each response, along with any others already waiting, with a
+single ``os.write``. Messages are still framed one JSON-RPC message per
+line, as the MCP stdio transport requires.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anyio
+import anyio.lowlevel
+import anyio.to_thread
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from mcp import types
+from mcp.shared.message import SessionMessage
+
+# Bytes requested from stdin per read
+_READ_SIZE = 65536
+
+# What the server reads: a message, or the error from parsing a bad line
+_Incoming = SessionMessage | Exception
+
+
+def _parse_line(line: bytes) -> _Incoming:
+    """Parse one line of stdin into a message, or the error it raised."""
+    try:
+        return SessionMessage(types.JSONRPCMessage.model_validate_json(line))
+    except Exception as exc:
+        return exc
+
+
+def _read_stdin(
+    fd: int,
+    loop: asyncio.AbstractEventLoop,
+    queue: "asyncio.Queue[list[_Incoming] | None]",
+) -> None:
+    """Read ``fd`` until EOF, queueing the messages of each chunk as a batch.
+
+    Runs on its own thread; ``None`` is queued at EOF.
+    """
+
+    def deliver(item: list[_Incoming] | None) -> bool:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # The event loop has closed; nobody is listening any more
+            return False
+        return True
+
+    buffer = bytearray()
+    while True:
+        try:
+            chunk = os.read(fd, _READ_SIZE)
+        except OSError:
+            break
+        if not chunk:
+            break
+
+        buffer += chunk
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            continue
+        lines = bytes(buffer[:end]).split(b"\n")
+        del buffer[: end + 1]
+        messages = [_parse_line(line) for line in lines if line.strip()]
+        if messages and not deliver(messages):
+            return
+
+    if buffer.strip() and not deliver([_parse_line(bytes(buffer))]):
+        return
+    deliver(None)
+
+
+def _encode(session_message: SessionMessage) -> bytes:
+    """Frame a message as one line of JSON."""
+    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+    return (json + "\n").encode()
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of ``data`` to ``fd``, however many writes it takes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+@asynccontextmanager
+async def buffered_stdio_server(
+    stdin_fd: int | None = None, stdout_fd: int | None = None
+) -> AsyncIterator[
+    tuple[MemoryObjectReceiveStream[_Incoming], MemoryObjectSendStream[SessionMessage]]
+]:
+    """Serve MCP over stdin/stdout (or the given file descriptors)."""
+    if stdin_fd is None:
+        stdin_fd = sys.stdin.fileno()
+    if stdout_fd is None:
+        # Anything printed before now must not land after our responses
+        sys.stdout.flush()
+        stdout_fd = sys.stdout.fileno()
+
+    read_stream_writer, read_stream = anyio.create_memory_object_stream[_Incoming](0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream[
+        SessionMessage
+    ](0)
+
+    queue: asyncio.Queue[list[_Incoming] | None] = asyncio.Queue()
+    threading.Thread(
+        target=_read_stdin,
+        args=(stdin_fd, asyncio.get_running_loop(), queue),
+        name="statsig-mcp-stdin",
+        daemon=True,
+    ).start()
+
+    async def stdin_forwarder() -> None:
+        try:
+            async with read_stream_writer:
+                while (batch := await queue.get()) is not None:
+                    for message in batch:
+                        await read_stream_writer.send(message)
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async def stdout_writer() -> None:
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    lines = [_encode(session_message)]
+                    # Replies already waiting to be sent share this write
+                    while True:
+                        try:
+                            lines.append(_encode(write_stream_reader.receive_nowait()))
+                        except (anyio.WouldBlock, anyio.EndOfStream):
+                            break
+                    await anyio.to_thread.run_sync(
+                        _write_all, stdout_fd, b"".join(lines)
+                    )
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(stdin_forwarder)
+        tg.start_soon(stdout_writer)
+        yield read_stream, write_stream
@@ -0,0 +1,68 @@
+"""
+On-disk cache of the MCP tool catalog for client-side tooling.
+
+Discovering tools requires spawning the server and performing the MCP
+handshake. The catalog only changes when the server code or its launch
+configuration changes, so clients can persist it between runs.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+_SERVER_MODULE = Path(__file__).with_name("server.py")
+
+
+def _cache_dir() -> Path:
+    """Return the directory holding cached tool catalogs."""
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "statsig_mcp"
+
+
+def tool_cache_key(
+    command: str, args: list[str], env: dict[str, str] | None = None
+) -> str:
+    """Build a cache key for a server launch configuration.
+
+    The key covers the command line, the environment passed to the server and
+    the modification time of ``server.py``, so editing the server invalidates
+    any cached catalog.
+    """
+    try:
+        server_mtime = _SERVER_MODULE.stat().st_mtime_ns
+    except OSError:
+        server_mtime = 0
+
+    digest = hashlib.sha256()
+    digest.update(command.encode())
+    for arg in args:
+        digest.update(b"\0" + arg.encode())
+    for name, value in sorted((env or {}).items()):
+        digest.update(f"\0{name}={value}".encode())
+    digest.update(f"\0{server_mtime}".encode())
+    return digest.hexdigest()
+
+
+def load_cached_tools(cache_key: str) -> list[dict[str, Any]] | None:
+    """Return the cached tool catalog for ``cache_key``, or None on a miss."""
+    path = _cache_dir() / f"tools-{cache_key}.json"
+    try:
+        tools = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return tools if isinstance(tools, list) else None
+
+
+def save_cached_tools(cache_key: str, tools: list[dict[str, Any]]) -> None:
+    """Persist ``tools`` under ``cache_key``; failures are ignored."""
+    cache_dir = _cache_dir()
+    path = cache_dir / f"tools-{cache_key}.json"
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(tools), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
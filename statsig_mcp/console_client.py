@@ -2,644 +2,1252 @@
 Statsig Console API client for MCP server.
 """
 
+import asyncio
+import functools
 import logging
 import os
-from typing import Any
+import random
+import socket
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
 
 import httpx
+import orjson
+
+try:
+    import ijson
+except ImportError:  # optional, installed by the "streaming" extra
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Errors raised for response bodies that aren't valid JSON
+_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+if ijson is not None:
+    _DECODE_ERRORS += (ijson.JSONError,)
+
+# Console API collection paths
+_GATES = "/console/v1/gates"
+_EXPERIMENTS = "/console/v1/experiments"
+_DYNAMIC_CONFIGS = "/console/v1/dynamic_configs"
+_SEGMENTS = "/console/v1/segments"
+_METRICS = "/console/v1/metrics"
+_AUDIT_LOGS = "/console/v1/audit_logs"
+_TARGET_APPS = "/console/v1/target_apps"
+_API_KEYS = "/console/v1/keys"
+_EVENTS = "/console/v1/events"
+_USERS = "/console/v1/users"
+
+
+class _Resource(NamedTuple):
+    """A Console API collection and the wording used in its results and logs."""
+
+    path: str
+    listing: str
+    getting: str
+    creating: str
+    updating: str
+    deleting: str
+    # str.format template for the not-found error, taking the item ID
+    missing: str
+
+
+def _resource(path: str, name: str) -> _Resource:
+    """Describe the collection at ``path`` whose items are called ``name``."""
+    return _Resource(
+        path,
+        f"listing {name}s",
+        f"getting {name}",
+        f"creating {name}",
+        f"updating {name}",
+        f"deleting {name}",
+        f"{name[0].upper()}{name[1:]} '{{}}' not found",
+    )
+
+
+def _missing_write(resource: _Resource, item_id: str) -> dict[str, Any]:
+    """Result of updating or deleting an item that doesn't exist."""
+    return {
+        "success": False,
+        "found": False,
+        "error": resource.missing.format(item_id),
+    }
+
+
+_GATE = _resource(_GATES, "gate")
+_EXPERIMENT = _resource(_EXPERIMENTS, "experiment")
+_DYNAMIC_CONFIG = _resource(_DYNAMIC_CONFIGS, "dynamic config")
+_SEGMENT = _resource(_SEGMENTS, "segment")
+_METRIC = _resource(_METRICS, "metric")
+_TARGET_APP = _resource(_TARGET_APPS, "target app")
+
+# update_gate argument names -> Console API field names
+_GATE_UPDATE_FIELDS = {
+    "name": "name",
+    "description": "description",
+    "is_enabled": "isEnabled",
+}
+
+# (fresh_ttl, stale_ttl) in seconds. Within fresh_ttl a cached response is
+# returned as is; until stale_ttl it is returned while a refresh runs in the
+# background; after that the next caller waits for a new request. Expired
+# entries are kept for conditional revalidation and as a fallback when the
+# API cannot be reached.
+_CACHE_POLICIES = {
+    "short": (5, 15),
+    "normal": (30, 120),
+    "long": (300, 900),
+}
+# The same TTLs in nanoseconds, for integer comparisons on the hot path
+_CACHE_POLICIES_NS = {
+    policy: (fresh_ttl * 1_000_000_000, stale_ttl * 1_000_000_000)
+    for policy, (fresh_ttl, stale_ttl) in _CACHE_POLICIES.items()
+}
+
+# Cache policy per collection. Reads under a collection are cached with its
+# policy and any write to it invalidates everything cached under it.
+_CACHE_RULES: tuple[tuple[str, str], ...] = (
+    (_TARGET_APPS, "long"),
+    (_API_KEYS, "long"),
+    (_AUDIT_LOGS, "short"),
+    (_GATES, "normal"),
+    (_EXPERIMENTS, "normal"),
+    (_DYNAMIC_CONFIGS, "normal"),
+    (_SEGMENTS, "normal"),
+    (_METRICS, "normal"),
+    (_USERS, "normal"),
+)
+
+# Retries of rate-limited or transiently failing requests, with exponential
+# backoff from _RETRY_BACKOFF seconds plus jitter unless the API sends
+# Retry-After (honored up to _MAX_RETRY_AFTER seconds)
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.1
+_MAX_RETRY_AFTER = 30.0
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# Returned by _cached_get for 404 responses, which are never cached
+_NOT_FOUND = object()
+
+
+class _HTTPError(NamedTuple):
+    """A failed Console API response, returned rather than raised."""
+
+    message: str
+
+
+def _status_error(response: httpx.Response) -> str:
+    """Describe a non-2xx response for error results."""
+    return f"HTTP {response.status_code}: {response.text[:512]}"
+
+
+class _Envelope(NamedTuple):
+    """How _call shapes a successful payload and an error message."""
+
+    ok: Callable[[Any], dict[str, Any]]
+    error: Callable[[str], dict[str, Any]]
+    # Whether the success payload needs the response body at all
+    parse: bool = True
+
+
+def _failed(error: str) -> dict[str, Any]:
+    return {"success": False, "error": error}
+
+
+_RAW = _Envelope(lambda data: data, lambda error: {"error": error})
+_CREATED = _Envelope(lambda data: {"success": True, "data": data}, _failed)
+_DONE = _Envelope(lambda data: {"success": True}, _failed, parse=False)
+_RESULT = _Envelope(
+    lambda data: {"success": True, "data": data, "error": None},
+    lambda error: {"success": False, "data": {}, "error": error},
+)
+
+
+def _cache_rule(path: str) -> tuple[str, str]:
+    """Return the ``(collection, policy)`` row of _CACHE_RULES covering ``path``."""
+    for rule in _CACHE_RULES:
+        if path.startswith(rule[0]):
+            return rule
+    return "/".join(path.split("/", 4)[:4]), "normal"
+
+
+class _AsyncByteReader:
+    """Present an async iterator of byte chunks as the async file ijson reads."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        """Return the next chunk, or b"" at the end of the stream."""
+        # ijson probes with read(0) to tell bytes from str
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+def _should_retry(method: str, response: httpx.Response) -> bool:
+    """Whether ``response`` is a transient failure worth sending again.
+
+    A 429 means the request was not processed, so any method is retried;
+    server errors are only retried for GETs, which are safe to repeat.
+    """
+    status = response.status_code
+    return status == 429 or (method == "GET" and status in _RETRY_STATUSES)
 
-class StatsigConsoleClient:
-    """Console API client for Statsig."""
 
-    def __init__(self) -> None:
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based), honoring Retry-After."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_AFTER)
+        except ValueError:
+            # An HTTP date; fall back to our own backoff
+            pass
+    return _RETRY_BACKOFF * 2**attempt + random.uniform(0, _RETRY_BACKOFF / 2)
+
+
+class _CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while the API is considered down."""
+
+
+class _CircuitBreaker:
+    """Fail fast after repeated network errors instead of waiting on timeouts.
+
+    After ``threshold`` consecutive transport errors the circuit opens and
+    requests fail immediately for ``cooldown`` seconds. After that requests
+    are let through again; one more failure reopens it and one success
+    closes it.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0) -> None:
+        self._threshold = threshold
+        self._cooldown_ns = int(cooldown * 1_000_000_000)
+        self._failures = 0
+        self._open_until = 0
+
+    def check(self) -> None:
+        """Raise ``_CircuitOpenError`` if the circuit is open."""
+        if self._open_until and time.monotonic_ns() < self._open_until:
+            raise _CircuitOpenError(
+                "Statsig Console API unavailable after repeated network errors"
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self._failures = 0
+        self._open_until = 0
+
+    def record_failure(self) -> None:
+        """Count a transport error, opening the circuit at the threshold."""
+        self._failures += 1
+        if self._failures >= self._threshold:
+            self._open_until = time.monotonic_ns() + self._cooldown_ns
+            logger.warning(
+                "Statsig Console API circuit open for %ss after %s network errors",
+                self._cooldown_ns // 1_000_000_000,
+                self._failures,
+            )
+
+
+class _ResponseCache:
+    """In-memory cache of Console API GET responses.
+
+    Entries are keyed by request path plus query string, so a mutation can
+    drop everything under a resource with ``invalidate(prefix)``. Cached
+    payloads are shared between callers and must be treated as read-only.
+    Past ``max_entries`` the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        # key -> (fresh_until, stale_until, payload, validators), with times
+        # in time.monotonic_ns() and validators the conditional-GET headers.
+        # Kept in least to most recently used order.
+        self._entries: dict[str, tuple[int, int, Any, dict[str, str]]] = {}
+        # key -> request currently fetching that key
+        self._inflight: dict[str, asyncio.Task] = {}
+        # Bumped on invalidation so requests started earlier don't store
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Token to pass to ``store``; it changes whenever entries are dropped."""
+        return self._generation
+
+    def inflight(self, key: str) -> asyncio.Task | None:
+        """Return the request currently fetching ``key``, if any."""
+        return self._inflight.get(key)
+
+    def share(self, key: str, task: asyncio.Task) -> None:
+        """Let later misses for ``key`` join ``task`` until it finishes."""
+        inflight = self._inflight
+        inflight[key] = task
+
+        def _done(task: asyncio.Task) -> None:
+            if inflight.get(key) is task:
+                del inflight[key]
+
+        task.add_done_callback(_done)
+
+    def lookup(self, key: str) -> tuple[Any, bool] | None:
+        """Return ``(payload, is_fresh)`` for ``key``, or None if unusable."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        # Move to the most recently used end
+        del self._entries[key]
+        self._entries[key] = entry
+
+        fresh_until, stale_until, payload, _ = entry
+        now = time.monotonic_ns()
+        if now < fresh_until:
+            return payload, True
+        if now < stale_until:
+            return payload, False
+        return None
+
+    def last_good(self, key: str) -> tuple[Any] | None:
+        """Return ``(payload,)`` for ``key`` however old it is, if cached."""
+        entry = self._entries.get(key)
+        return (entry[2],) if entry is not None else None
+
+    def store(
+        self,
+        key: str,
+        payload: Any,
+        policy: str,
+        generation: int,
+        headers: httpx.Headers | None = None,
+    ) -> None:
+        """Cache ``payload`` unless the cache was invalidated since ``generation``.
+
+        ``ETag`` and ``Last-Modified`` from the response ``headers`` are kept
+        so the entry can later be revalidated with a conditional GET.
+        """
+        if generation != self._generation:
+            return
+
+        validators = {}
+        if headers is not None:
+            if etag := headers.get("etag"):
+                validators["If-None-Match"] = etag
+            if last_modified := headers.get("last-modified"):
+                validators["If-Modified-Since"] = last_modified
+
+        fresh_ttl, stale_ttl = _CACHE_POLICIES_NS[policy]
+        now = time.monotonic_ns()
+        entries = self._entries
+        entries.pop(key, None)
+        entries[key] = (now + fresh_ttl, now + stale_ttl, payload, validators)
+        if len(entries) > self._max_entries:
+            del entries[next(iter(entries))]
+
+    def validators(self, key: str) -> dict[str, str] | None:
+        """Return conditional-GET headers for ``key``'s entry, if it has any."""
+        entry = self._entries.get(key)
+        if entry is None or not entry[3]:
+            return None
+        return entry[3]
+
+    def refresh(self, key: str, policy: str) -> tuple[Any] | None:
+        """Restart ``key``'s TTLs after a 304, returning ``(payload,)`` if cached."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        fresh_ttl, stale_ttl = _CACHE_POLICIES_NS[policy]
+        now = time.monotonic_ns()
+        self._entries[key] = (now + fresh_ttl, now + stale_ttl, entry[2], entry[3])
+        return (entry[2],)
+
+    def discard(self, key: str) -> None:
+        """Drop a single entry."""
+        self._entries.pop(key, None)
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop cached and in-flight entries whose key starts with ``prefix``."""
+        self._generation += 1
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+        # Later callers must not join requests that started before the change
+        for key in [key for key in self._inflight if key.startswith(prefix)]:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop every entry and cancel in-flight requests."""
+        self._generation += 1
+        self._entries.clear()
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+
+
+_API_VERSION = "20240601"
+
+# Headers sent with every Console API request, apart from the API key
+_HEADERS_TEMPLATE = {
+    "STATSIG-API-VERSION": _API_VERSION,
+    "Content-Type": "application/json",
+}
+
+# Parsed request paths. Collection paths and recently used item paths are
+# parsed once instead of on every request; httpx resolves them against the
+# client's base_url.
+_parse_url = functools.lru_cache(maxsize=1024)(httpx.URL)
+
+# Identifies a shared HTTP client:
+# (base_url, api_key, max_connections, max_keepalive_connections)
+_ClientKey = tuple[str, str, int, int]
+
+# HTTP clients shared by every StatsigConsoleClient with the same key, with
+# a count of the instances using each. Creating a client never awaits, so
+# the event loop already serializes access.
+_shared_clients: dict[_ClientKey, tuple[httpx.AsyncClient, int]] = {}
+
+
+def _acquire_client(key: _ClientKey, api_key: str) -> httpx.AsyncClient:
+    """Return the shared HTTP client for ``key``, creating it on first use."""
+    entry = _shared_clients.get(key)
+    if entry is not None:
+        client, refs = entry
+        _shared_clients[key] = (client, refs + 1)
+        return client
+
+    # Create HTTP client with proper headers for Console API
+    console_headers = {**_HEADERS_TEMPLATE, "STATSIG-API-KEY": api_key}
+
+    # Every request goes to one host, so HTTP/2 (negotiated via ALPN)
+    # multiplexes concurrent calls over a single connection
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=key[2],
+            max_keepalive_connections=key[3],
+            keepalive_expiry=60.0,
+        ),
+        # Retry failed connection attempts once
+        retries=1,
+        # Small JSON requests shouldn't wait on Nagle's algorithm
+        socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+    )
+    client = httpx.AsyncClient(
+        base_url=key[0],
+        headers=console_headers,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        transport=transport,
+    )
+    _shared_clients[key] = (client, 1)
+    return client
+
+
+async def _release_client(key: _ClientKey | None, client: httpx.AsyncClient) -> None:
+    """Drop one reference to a shared client, closing it with the last one."""
+    entry = _shared_clients.get(key) if key is not None else None
+    if entry is None or entry[0] is not client:
+        # Not a shared client (e.g. one injected by tests)
+        await client.aclose()
+        return
+
+    refs = entry[1] - 1
+    if refs:
+        _shared_clients[key] = (client, refs)
+        return
+
+    del _shared_clients[key]
+    await client.aclose()
+
+
+class StatsigConsoleClient:
+    """Console API client for Statsig.
+
+    ``api_key`` defaults to the STATSIG_CONSOLE_API_KEY environment
+    variable. ``max_connections`` and ``max_keepalive_connections`` size the
+    HTTP connection pool; clients with the same API key and pool sizes
+    share one pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+    ) -> None:
         """Initialize the Console API client."""
         self._initialized = False
-        self._console_api_key: str | None = None
-        self._api_version = "20240601"
+        self._console_api_key = api_key
+        self._api_version = _API_VERSION
         self._base_url = "https://statsigapi.net"
         self._client: httpx.AsyncClient | None = None
+        self._client_key: _ClientKey | None = None
+        self._limits = (max_connections, max_keepalive_connections)
+        self._cache = _ResponseCache(
+            int(os.getenv("STATSIG_CACHE_MAX_ENTRIES", "1024"))
+        )
+        # Caps in-flight requests so large fan-outs don't trip rate limits
+        self._sem = asyncio.Semaphore(int(os.getenv("STATSIG_MAX_CONCURRENCY", "10")))
+        self._breaker = _CircuitBreaker()
+        self._invalidate_hooks: list[Callable[[str], None]] = []
 
     async def initialize(self) -> None:
         """Initialize the Console API client."""
         if self._initialized:
             return
 
-        # Get Console API key from environment
-        self._console_api_key = os.getenv("STATSIG_CONSOLE_API_KEY")
+        # Fall back to the environment when no key was passed in
+        if not self._console_api_key:
+            self._console_api_key = os.getenv("STATSIG_CONSOLE_API_KEY")
         if not self._console_api_key:
             raise ValueError("STATSIG_CONSOLE_API_KEY environment variable is required")
 
-        # Create HTTP client with proper headers for Console API
-        console_headers = {
-            "STATSIG-API-KEY": self._console_api_key,
-            "STATSIG-API-VERSION": self._api_version,
-            "Content-Type": "application/json",
-        }
+        self._client_key = (self._base_url, self._console_api_key, *self._limits)
+        self._client = _acquire_client(self._client_key, self._console_api_key)
 
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url, headers=console_headers, timeout=30.0
+        self._initialized = True
+        loop_type = type(asyncio.get_running_loop())
+        logger.info(
+            "Statsig Console API client initialized successfully (event loop: %s.%s)",
+            loop_type.__module__,
+            loop_type.__name__,
         )
 
-        self._initialized = True
-        logger.info("Statsig Console API client initialized successfully")
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, waiting for a free concurrency slot first."""
+        return await self._send(
+            method,
+            url,
+            lambda: self._client.request(method, _parse_url(url), **kwargs),
+        )
 
-    # Gates
-    async def list_gates(self, limit: int | None = None) -> dict[str, Any]:
-        """List all feature gates."""
-        if not self._initialized or not self._client:
+    async def _send(
+        self, method: str, url: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Run ``send`` in a concurrency slot, with retries and the breaker.
+
+        Rate-limited requests, and GETs that hit a transient server error,
+        are retried with backoff. Raises ``_CircuitOpenError`` without
+        sending anything while the circuit breaker is open.
+        """
+        breaker = self._breaker
+        attempt = 0
+        while True:
+            breaker.check()
+            async with self._sem:
+                # The circuit may have opened while this request was queued
+                breaker.check()
+                try:
+                    response = await send()
+                except httpx.TransportError:
+                    breaker.record_failure()
+                    raise
+            breaker.record_success()
+
+            if attempt == _MAX_RETRIES or not _should_retry(method, response):
+                return response
+            delay = _retry_delay(response, attempt)
+            logger.debug(
+                "Retrying %s %s after HTTP %d in %.2fs",
+                method,
+                url,
+                response.status_code,
+                delay,
+            )
+            # Back off without holding a concurrency slot
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _call(
+        self,
+        method: str,
+        path: str,
+        action: str,
+        *,
+        params: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+        cache: bool = True,
+        not_found: dict[str, Any] | None = None,
+        envelope: _Envelope = _RAW,
+    ) -> dict[str, Any]:
+        """Make a Console API request and shape its result for the tools.
+
+        GETs go through the response cache under their collection's policy
+        in _CACHE_RULES (with ``cache=False`` they only share identical
+        in-flight requests); any other successful request, or one that finds
+        its target gone, drops cached reads under the same collection. A 404
+        returns ``not_found`` when given. HTTP error statuses are handled
+        without raising; they and network errors are logged against
+        ``action`` and ``path`` and returned via ``envelope``.
+        """
+        if self._client is None:
             raise RuntimeError("Console API client not initialized")
 
         try:
-            url = "/console/v1/gates"
-            if limit:
-                url += f"?limit={limit}"
-
-            response = await self._client.get(url)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error listing gates: {e}")
-            return {"error": str(e)}
+            if method == "GET":
+                data = await self._cached_get(
+                    path,
+                    params,
+                    _cache_rule(path)[1] if cache else None,
+                    missing_ok=not_found is not None,
+                )
+            else:
+                # Content-Type: application/json is already a default header
+                content = orjson.dumps(body) if body is not None else None
+                response = await self._request(
+                    method, path, params=params, content=content
+                )
+                if not_found is not None and response.status_code == 404:
+                    # Reads cached before the item disappeared are stale too
+                    self._cache.invalidate(_cache_rule(path)[0])
+                    return not_found
+                if not response.is_success:
+                    data = _HTTPError(_status_error(response))
+                else:
+                    self._cache.invalidate(_cache_rule(path)[0])
+                    data = orjson.loads(response.content) if envelope.parse else None
+        # Network failures and undecodable bodies; HTTP errors don't raise
+        except (httpx.TransportError, ValueError) as e:
+            logger.error("Error %s %s: %s", action, path, e)
+            return envelope.error(str(e))
+
+        if data is _NOT_FOUND:
+            return not_found
+        if isinstance(data, _HTTPError):
+            logger.error("Error %s %s: %s", action, path, data.message)
+            return envelope.error(data.message)
+        return envelope.ok(data)
+
+    async def _get_many(
+        self,
+        get_one: Callable[[str], Awaitable[dict[str, Any]]],
+        ids: list[str],
+        concurrency: int | None = None,
+    ) -> dict[str, Any]:
+        """Run ``get_one`` for every id concurrently and key the results by id.
 
-    async def get_gate(self, gate_id: str) -> dict[str, Any]:
-        """Get details of a specific feature gate."""
-        if not self._initialized or not self._client:
+        The requests share the concurrency limit and HTTP/2 connection, so N
+        lookups take roughly one round trip. ``concurrency`` caps this batch
+        further. A lookup that raises is returned as its exception.
+        """
+        if self._client is None:
             raise RuntimeError("Console API client not initialized")
 
+        fetch = get_one
+        if concurrency is not None:
+            sem = asyncio.Semaphore(concurrency)
+
+            async def fetch(item_id: str) -> dict[str, Any]:
+                async with sem:
+                    return await get_one(item_id)
+
+        results = await asyncio.gather(
+            *(fetch(item_id) for item_id in ids), return_exceptions=True
+        )
+        return dict(zip(ids, results, strict=True))
+
+    async def _cached_get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        policy: str | None = None,
+        missing_ok: bool = False,
+    ) -> Any:
+        """GET ``path`` through the response cache.
+
+        Fresh hits return immediately and stale hits return immediately while
+        a background request refreshes them. Concurrent misses for the same
+        key share one request; with ``policy=None`` nothing is cached but
+        concurrent identical requests are still shared. With ``missing_ok``
+        a 404 returns ``_NOT_FOUND`` and other error statuses return an
+        ``_HTTPError``; neither is cached. Network errors raise unless an
+        expired entry can be served instead.
+        """
+        cache = self._cache
+        key = f"{path}?{urlencode(sorted(params.items()))}" if params else path
+
+        cached = cache.lookup(key)
+        if cached is not None:
+            payload, fresh = cached
+            if not fresh:
+                self._start_fetch(key, path, params, policy, missing_ok)
+            return payload
+
         try:
-            response = await self._client.get(f"/console/v1/gates/{gate_id}")
-            if response.status_code == 404:
-                return {"found": False, "error": f"Gate '{gate_id}' not found"}
+            return await asyncio.shield(
+                self._start_fetch(key, path, params, policy, missing_ok)
+            )
+        except httpx.TransportError:
+            # Prefer an expired response to no response when the API is down
+            last_good = cache.last_good(key)
+            if last_good is None:
+                raise
+            logger.warning("Serving expired %s after a network error", key)
+            return last_good[0]
+
+    def _start_fetch(
+        self,
+        key: str,
+        path: str,
+        params: dict[str, Any] | None,
+        policy: str | None,
+        missing_ok: bool,
+    ) -> asyncio.Task:
+        """Return the in-flight request for ``key``, starting one if needed."""
+        task = self._cache.inflight(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch(key, path, params, policy, missing_ok)
+            )
+            self._cache.share(key, task)
+
+            def _done(task: asyncio.Task) -> None:
+                # Background refreshes have no awaiter to see their errors.
+                # Always retrieve the exception so asyncio doesn't report it
+                # as unhandled, but only format it when debug logging is on.
+                if task.cancelled() or (exc := task.exception()) is None:
+                    return
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Refreshing %s failed: %s", key, exc)
+
+            task.add_done_callback(_done)
+        return task
+
+    async def _fetch(
+        self,
+        key: str,
+        path: str,
+        params: dict[str, Any] | None,
+        policy: str | None,
+        missing_ok: bool,
+    ) -> Any:
+        """Request ``path`` and store a successful response in the cache.
+
+        Refreshing a cached entry sends its ``ETag``/``Last-Modified``
+        validators, so an unchanged resource comes back as an empty 304.
+        """
+        cache = self._cache
+        generation = cache.generation
+        response = await self._request(
+            "GET", path, params=params, headers=cache.validators(key)
+        )
+        if response.status_code == 304:
+            refreshed = cache.refresh(key, policy)
+            if refreshed is not None:
+                return refreshed[0]
+            # The entry was invalidated while the request was in flight
+            response = await self._request("GET", path, params=params)
+
+        if missing_ok and response.status_code == 404:
+            cache.discard(key)
+            return _NOT_FOUND
+
+        if not response.is_success:
+            return _HTTPError(_status_error(response))
+
+        payload = orjson.loads(response.content)
+        if policy is not None:
+            cache.store(key, payload, policy, generation, response.headers)
+        return payload
+
+    async def _first_items(self, path: str, limit: int) -> list[Any] | _HTTPError:
+        """Return up to ``limit`` entries of the ``data`` array at ``path``.
+
+        With ijson installed the body is parsed as it arrives and the
+        download stops once ``limit`` entries have been read; otherwise the
+        whole body is parsed and sliced.
+        """
+        # The tool schema types limit as a number, so 5.0 can arrive here
+        limit = int(limit)
+        if ijson is None:
+            response = await self._request("GET", path)
+            if not response.is_success:
+                return _HTTPError(_status_error(response))
+            return orjson.loads(response.content).get("data", [])[:limit]
+
+        items: list[Any] = []
+
+        async def stream() -> httpx.Response:
+            async with self._client.stream("GET", _parse_url(path)) as response:
+                if not response.is_success:
+                    # Read the error body for _status_error and retries
+                    await response.aread()
+                elif limit > 0:
+                    reader = _AsyncByteReader(response.aiter_bytes())
+                    async for item in ijson.items_async(
+                        reader, "data.item", use_float=True
+                    ):
+                        items.append(item)
+                        if len(items) >= limit:
+                            break
+            return response
+
+        # Successful responses are never retried, so items is filled once
+        response = await self._send("GET", path, stream)
+        if not response.is_success:
+            return _HTTPError(_status_error(response))
+        return items
+
+    # Collection helpers shared by the per-resource methods below
+    async def _list(
+        self, resource: _Resource, limit: int | None = None
+    ) -> dict[str, Any]:
+        """List a collection, optionally capped at ``limit`` items."""
+        params = {"limit": limit} if limit else None
+        return await self._call("GET", resource.path, resource.listing, params=params)
+
+    async def _get(self, resource: _Resource, item_id: str) -> dict[str, Any]:
+        """Get one item, reporting a missing item instead of an error."""
+        return await self._call(
+            "GET",
+            f"{resource.path}/{item_id}",
+            resource.getting,
+            not_found={"found": False, "error": resource.missing.format(item_id)},
+        )
 
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error getting gate {gate_id}: {e}")
-            return {"error": str(e)}
+    async def _create(
+        self, resource: _Resource, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Create an item in a collection."""
+        return await self._call(
+            "POST", resource.path, resource.creating, body=data, envelope=_CREATED
+        )
+
+    async def _update(
+        self, resource: _Resource, item_id: str, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Apply ``data`` to an existing item."""
+        return await self._call(
+            "PATCH",
+            f"{resource.path}/{item_id}",
+            resource.updating,
+            body=data,
+            not_found=_missing_write(resource, item_id),
+            envelope=_DONE,
+        )
+
+    async def _delete(self, resource: _Resource, item_id: str) -> dict[str, Any]:
+        """Delete an item."""
+        return await self._call(
+            "DELETE",
+            f"{resource.path}/{item_id}",
+            resource.deleting,
+            not_found=_missing_write(resource, item_id),
+            envelope=_DONE,
+        )
+
+    # Gates
+    async def list_gates(self, limit: int | None = None) -> dict[str, Any]:
+        """List all feature gates."""
+        return await self._list(_GATE, limit)
+
+    async def get_gate(self, gate_id: str) -> dict[str, Any]:
+        """Get details of a specific feature gate."""
+        return await self._get(_GATE, gate_id)
+
+    async def get_gates(
+        self, gate_ids: list[str], concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """Get several feature gates concurrently, keyed by gate ID."""
+        return await self._get_many(self.get_gate, gate_ids, concurrency)
 
     async def create_gate(
         self, name: str, description: str = "", is_enabled: bool = False
     ) -> dict[str, Any]:
         """Create a new feature gate."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            data = {"name": name, "description": description, "isEnabled": is_enabled}
-
-            response = await self._client.post("/console/v1/gates", json=data)
-            response.raise_for_status()
-            result = response.json()
-            return {"success": True, "data": result}
-        except Exception as e:
-            logger.error(f"Error creating gate {name}: {e}")
-            return {"success": False, "error": str(e)}
+        data = {"name": name, "description": description, "isEnabled": is_enabled}
+        return await self._create(_GATE, data)
 
     async def update_gate(
         self, gate_id: str, updates: dict[str, Any]
     ) -> dict[str, Any]:
         """Update an existing feature gate."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
+        # Convert updates to API format, dropping fields the API doesn't take
+        data = {
+            _GATE_UPDATE_FIELDS[field]: value
+            for field, value in updates.items()
+            if field in _GATE_UPDATE_FIELDS
+        }
+        return await self._update(_GATE, gate_id, data)
 
-        try:
-            # Convert updates to API format
-            data = {}
-            if "name" in updates:
-                data["name"] = updates["name"]
-            if "description" in updates:
-                data["description"] = updates["description"]
-            if "is_enabled" in updates:
-                data["isEnabled"] = updates["is_enabled"]
-
-            response = await self._client.patch(
-                f"/console/v1/gates/{gate_id}", json=data
-            )
-            response.raise_for_status()
-            return {"success": True}
-        except Exception as e:
-            logger.error(f"Error updating gate {gate_id}: {e}")
-            return {"success": False, "error": str(e)}
+    async def update_gates(
+        self, updates: dict[str, dict[str, Any]], concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """Update several feature gates concurrently, keyed by gate ID.
+
+        ``updates`` maps each gate ID to the changes for that gate.
+        """
+        return await self._get_many(
+            lambda gate_id: self.update_gate(gate_id, updates[gate_id]),
+            list(updates),
+            concurrency,
+        )
 
     async def delete_gate(self, gate_id: str) -> dict[str, Any]:
         """Delete a feature gate."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.delete(f"/console/v1/gates/{gate_id}")
-            response.raise_for_status()
-            return {"success": True}
-        except Exception as e:
-            logger.error(f"Error deleting gate {gate_id}: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._delete(_GATE, gate_id)
 
     # Experiments
     async def list_experiments(self, limit: int | None = None) -> dict[str, Any]:
         """List all experiments."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            url = "/console/v1/experiments"
-            if limit:
-                url += f"?limit={limit}"
-
-            response = await self._client.get(url)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error listing experiments: {e}")
-            return {"error": str(e)}
+        return await self._list(_EXPERIMENT, limit)
 
     async def get_experiment(self, experiment_id: str) -> dict[str, Any]:
         """Get details of a specific experiment."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.get(
-                f"/console/v1/experiments/{experiment_id}"
-            )
-            if response.status_code == 404:
-                return {
-                    "found": False,
-                    "error": f"Experiment '{experiment_id}' not found",
-                }
+        return await self._get(_EXPERIMENT, experiment_id)
 
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error getting experiment {experiment_id}: {e}")
-            return {"error": str(e)}
+    async def get_experiments(
+        self, experiment_ids: list[str], concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """Get several experiments concurrently, keyed by experiment ID."""
+        return await self._get_many(self.get_experiment, experiment_ids, concurrency)
 
     async def create_experiment(
         self, name: str, description: str = "", hypothesis: str | None = None
     ) -> dict[str, Any]:
         """Create a new experiment."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            data = {"name": name, "description": description}
-            if hypothesis:
-                data["hypothesis"] = hypothesis
-
-            response = await self._client.post("/console/v1/experiments", json=data)
-            response.raise_for_status()
-            result = response.json()
-            return {"success": True, "data": result}
-        except Exception as e:
-            logger.error(f"Error creating experiment {name}: {e}")
-            return {"success": False, "error": str(e)}
+        data = {"name": name, "description": description}
+        if hypothesis:
+            data["hypothesis"] = hypothesis
+        return await self._create(_EXPERIMENT, data)
 
     async def update_experiment(
         self, experiment_id: str, updates: dict[str, Any]
     ) -> dict[str, Any]:
         """Update an existing experiment."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.patch(
-                f"/console/v1/experiments/{experiment_id}", json=updates
-            )
-            response.raise_for_status()
-            return {"success": True}
-        except Exception as e:
-            logger.error(f"Error updating experiment {experiment_id}: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._update(_EXPERIMENT, experiment_id, updates)
 
     async def delete_experiment(self, experiment_id: str) -> dict[str, Any]:
         """Delete an experiment."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.delete(
-                f"/console/v1/experiments/{experiment_id}"
-            )
-            response.raise_for_status()
-            return {"success": True}
-        except Exception as e:
-            logger.error(f"Error deleting experiment {experiment_id}: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._delete(_EXPERIMENT, experiment_id)
 
     # Dynamic Configs
     async def list_dynamic_configs(self, limit: int | None = None) -> dict[str, Any]:
         """List all dynamic configs."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            url = "/console/v1/dynamic_configs"
-            if limit:
-                url += f"?limit={limit}"
-
-            response = await self._client.get(url)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error listing dynamic configs: {e}")
-            return {"error": str(e)}
+        return await self._list(_DYNAMIC_CONFIG, limit)
 
     async def get_dynamic_config(self, config_id: str) -> dict[str, Any]:
         """Get details of a specific dynamic config."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.get(
-                f"/console/v1/dynamic_configs/{config_id}"
-            )
-            if response.status_code == 404:
-                return {
-                    "found": False,
-                    "error": f"Dynamic config '{config_id}' not found",
-                }
+        return await self._get(_DYNAMIC_CONFIG, config_id)
 
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error getting dynamic config {config_id}: {e}")
-            return {"error": str(e)}
+    async def get_dynamic_configs(
+        self, config_ids: list[str], concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """Get several dynamic configs concurrently, keyed by config ID."""
+        return await self._get_many(self.get_dynamic_config, config_ids, concurrency)
 
     async def create_dynamic_config(
         self, name: str, description: str = ""
     ) -> dict[str, Any]:
         """Create a new dynamic config."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            data = {"name": name, "description": description}
-
-            response = await self._client.post("/console/v1/dynamic_configs", json=data)
-            response.raise_for_status()
-            result = response.json()
-            return {"success": True, "data": result}
-        except Exception as e:
-            logger.error(f"Error creating dynamic config {name}: {e}")
-            return {"success": False, "error": str(e)}
+        data = {"name": name, "description": description}
+        return await self._create(_DYNAMIC_CONFIG, data)
 
     async def update_dynamic_config(
         self, config_id: str, updates: dict[str, Any]
     ) -> dict[str, Any]:
         """Update an existing dynamic config."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.patch(
-                f"/console/v1/dynamic_configs/{config_id}", json=updates
-            )
-            response.raise_for_status()
-            return {"success": True}
-        except Exception as e:
-            logger.error(f"Error updating dynamic config {config_id}: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._update(_DYNAMIC_CONFIG, config_id, updates)
 
     async def delete_dynamic_config(self, config_id: str) -> dict[str, Any]:
         """Delete a dynamic config."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.delete(
-                f"/console/v1/dynamic_configs/{config_id}"
-            )
-            response.raise_for_status()
-            return {"success": True}
-        except Exception as e:
-            logger.error(f"Error deleting dynamic config {config_id}: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._delete(_DYNAMIC_CONFIG, config_id)
 
     # Segments
     async def list_segments(self, limit: int | None = None) -> dict[str, Any]:
         """List all segments."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            url = "/console/v1/segments"
-            if limit:
-                url += f"?limit={limit}"
-
-            response = await self._client.get(url)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error listing segments: {e}")
-            return {"error": str(e)}
+        return await self._list(_SEGMENT, limit)
 
     async def get_segment(self, segment_id: str) -> dict[str, Any]:
         """Get details of a specific segment."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
+        return await self._get(_SEGMENT, segment_id)
 
-        try:
-            response = await self._client.get(f"/console/v1/segments/{segment_id}")
-            if response.status_code == 404:
-                return {"found": False, "error": f"Segment '{segment_id}' not found"}
-
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error getting segment {segment_id}: {e}")
-            return {"error": str(e)}
+    async def get_segments(
+        self, segment_ids: list[str], concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """Get several segments concurrently, keyed by segment ID."""
+        return await self._get_many(self.get_segment, segment_ids, concurrency)
 
     async def create_segment(self, name: str, description: str = "") -> dict[str, Any]:
         """Create a new segment."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            data = {"name": name, "description": description}
-
-            response = await self._client.post("/console/v1/segments", json=data)
-            response.raise_for_status()
-            result = response.json()
-            return {"success": True, "data": result}
-        except Exception as e:
-            logger.error(f"Error creating segment {name}: {e}")
-            return {"success": False, "error": str(e)}
+        data = {"name": name, "description": description}
+        return await self._create(_SEGMENT, data)
 
     # Metrics
     async def list_metrics(self, limit: int | None = None) -> dict[str, Any]:
         """List all metrics."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            url = "/console/v1/metrics"
-            if limit:
-                url += f"?limit={limit}"
-
-            response = await self._client.get(url)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error listing metrics: {e}")
-            return {"error": str(e)}
+        return await self._list(_METRIC, limit)
 
     async def get_metric(self, metric_id: str) -> dict[str, Any]:
         """Get details of a specific metric."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.get(f"/console/v1/metrics/{metric_id}")
-            if response.status_code == 404:
-                return {"found": False, "error": f"Metric '{metric_id}' not found"}
+        return await self._get(_METRIC, metric_id)
 
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error getting metric {metric_id}: {e}")
-            return {"error": str(e)}
+    async def get_metrics(
+        self, metric_ids: list[str], concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """Get several metrics concurrently, keyed by metric ID."""
+        return await self._get_many(self.get_metric, metric_ids, concurrency)
 
     # Audit Logs
     async def list_audit_logs(
         self, limit: int = 20, from_date: str | None = None, to_date: str | None = None
     ) -> dict[str, Any]:
         """List audit logs."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            params = {"limit": limit}
-            if from_date:
-                params["from"] = from_date
-            if to_date:
-                params["to"] = to_date
-
-            response = await self._client.get("/console/v1/audit_logs", params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error listing audit logs: {e}")
-            return {"error": str(e)}
+        params = {"limit": limit}
+        if from_date:
+            params["from"] = from_date
+        if to_date:
+            params["to"] = to_date
+
+        return await self._call(
+            "GET",
+            _AUDIT_LOGS,
+            "listing audit logs",
+            params=params,
+        )
 
     # Target Apps
     async def list_target_apps(self) -> dict[str, Any]:
         """List all target apps."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.get("/console/v1/target_apps")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error listing target apps: {e}")
-            return {"error": str(e)}
+        return await self._list(_TARGET_APP)
 
     async def get_target_app(self, app_id: str) -> dict[str, Any]:
         """Get details of a specific target app."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.get(f"/console/v1/target_apps/{app_id}")
-            if response.status_code == 404:
-                return {"found": False, "error": f"Target app '{app_id}' not found"}
-
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error getting target app {app_id}: {e}")
-            return {"error": str(e)}
+        return await self._get(_TARGET_APP, app_id)
 
     # API Keys
     async def list_api_keys(self) -> dict[str, Any]:
         """List all API keys."""
-        if not self._initialized or not self._client:
-            raise RuntimeError("Console API client not initialized")
-
-        try:
-            response = await self._client.get("/console/v1/keys")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error listing API keys: {e}")
-            return {"error": str(e)}
+        return await self._call("GET", _API_KEYS, "listing API keys")
 
     # Events (keeping existing functionality)
     async def query_events(
         self, event_name: str | None = None, limit: int = 10
     ) -> dict[str, Any]:
         """Query events using Console API - shows event types, not user-specific events."""
-        if not self._initialized or not self._client:
+        if self._client is None:
             raise RuntimeError("Console API client not initialized")
 
         try:
             if event_name:
                 # Get specific event details
-                response = await self._client.get(f"/console/v1/events/{event_name}")
-                if response.status_code == 404:
+                data = await self._cached_get(
+                    f"{_EVENTS}/{event_name}", missing_ok=True
+                )
+                if data is _NOT_FOUND:
                     return {
                         "event_name": event_name,
                         "found": False,
                         "message": f"Event '{event_name}' not found",
                     }
-                response.raise_for_status()
-                data = response.json()
-                return {"event_name": event_name, "found": True, "details": data}
+                if not isinstance(data, _HTTPError):
+                    return {"event_name": event_name, "found": True, "details": data}
+                error = data.message
             else:
-                # List all events
-                response = await self._client.get("/console/v1/events")
-                response.raise_for_status()
-                data = response.json()
-
-                events = data.get("data", [])[:limit]
-
-                return {
-                    "event_types": events,
-                    "total_found": len(events),
-                    "note": "This shows event types, not user-specific events. Use Statsig Console for user event history.",
-                }
-
-        except Exception as e:
-            logger.error(f"Error querying events: {e}")
-            return {
-                "error": str(e),
-                "message": "Failed to query events via Console API",
-            }
+                # List all events, reading only as many as were asked for
+                events = await self._first_items(_EVENTS, limit)
+                if not isinstance(events, _HTTPError):
+                    return {
+                        "event_types": events,
+                        "total_found": len(events),
+                        "note": "This shows event types, not user-specific events. Use Statsig Console for user event history.",
+                    }
+                error = events.message
+        except (httpx.TransportError, *_DECODE_ERRORS) as e:
+            error = str(e)
+
+        logger.error("Error querying events: %s", error)
+        return {
+            "error": error,
+            "message": "Failed to query events via Console API",
+        }
 
     # Users (keeping existing functionality)
     async def get_user_by_email(self, email: str) -> dict[str, Any]:
         """Get user by email using Console API."""
-        if not self._initialized or not self._client:
+        if self._client is None:
             raise RuntimeError("Console API client not initialized")
 
         try:
-            response = await self._client.get(f"/console/v1/users/{email}")
+            data = await self._cached_get(f"{_USERS}/{email}", missing_ok=True)
 
-            if response.status_code == 404:
+            if data is _NOT_FOUND:
                 return {
                     "email": email,
                     "found": False,
                     "message": f"User with email '{email}' not found in Statsig team",
                 }
 
-            response.raise_for_status()
-            data = response.json()
+            if not isinstance(data, _HTTPError):
+                return {
+                    "email": email,
+                    "found": True,
+                    "user_data": data,
+                    "note": "This shows team member info, not end-user data",
+                }
 
-            return {
-                "email": email,
-                "found": True,
-                "user_data": data,
-                "note": "This shows team member info, not end-user data",
-            }
+            error = data.message
+        except (httpx.TransportError, ValueError) as e:
+            error = str(e)
 
-        except Exception as e:
-            logger.error(f"Error getting user by email: {e}")
-            return {
-                "email": email,
-                "found": False,
-                "error": str(e),
-                "message": "Failed to get user via Console API",
-            }
+        logger.error("Error getting user by email: %s", error)
+        return {
+            "email": email,
+            "found": False,
+            "error": error,
+            "message": "Failed to get user via Console API",
+        }
 
     async def list_team_users(self) -> dict[str, Any]:
         """List team users using Console API."""
-        if not self._initialized or not self._client:
+        if self._client is None:
             raise RuntimeError("Console API client not initialized")
 
         try:
-            response = await self._client.get("/console/v1/users")
-            response.raise_for_status()
-            data = response.json()
-
-            users = data.get("data", [])
+            data = await self._cached_get(_USERS, policy=_cache_rule(_USERS)[1])
+        except (httpx.TransportError, ValueError) as e:
+            data = _HTTPError(str(e))
 
+        if isinstance(data, _HTTPError):
+            logger.error("Error listing team users: %s", data.message)
             return {
-                "team_users": users,
-                "total_users": len(users),
-                "note": "These are team members, not end-users",
-            }
-
-        except Exception as e:
-            logger.error(f"Error listing team users: {e}")
-            return {
-                "error": str(e),
+                "error": data.message,
                 "message": "Failed to list team users via Console API",
             }
 
+        users = data.get("data", [])
+
+        return {
+            "team_users": users,
+            "total_users": len(users),
+            "note": "These are team members, not end-users",
+        }
+
     # Experiment Results and Analytics
-    async def get_experiment_results(self, experiment_id: str, include_metrics: bool = True) -> dict[str, Any]:
+    async def get_experiment_results(
+        self, experiment_id: str, include_metrics: bool = True
+    ) -> dict[str, Any]:
         """Get comprehensive experiment results including statistical analysis."""
-        if not self._initialized:
-            raise RuntimeError("Client not initialized. Call initialize() first.")
-        
-        try:
-            url = f"/console/v1/experiments/{experiment_id}/results"
-            params = {"include_metrics": "true" if include_metrics else "false"}
-            response = await self._client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"Retrieved results for experiment {experiment_id}")
-            return {"success": True, "data": data, "error": None}
-        except Exception as e:
-            logger.error(f"Error getting experiment results for {experiment_id}: {e}")
-            return {"success": False, "data": {}, "error": str(e)}
+        result = await self._call(
+            "GET",
+            f"{_EXPERIMENTS}/{experiment_id}/results",
+            "getting experiment results",
+            params={"include_metrics": "true" if include_metrics else "false"},
+            cache=False,
+            envelope=_RESULT,
+        )
+        if result["success"]:
+            logger.info("Retrieved results for experiment %s", experiment_id)
+        return result
 
     async def get_experiment_pulse(self, experiment_id: str) -> dict[str, Any]:
         """Get experiment pulse data with health metrics and performance indicators."""
-        if not self._initialized:
-            raise RuntimeError("Client not initialized. Call initialize() first.")
-        
-        try:
-            url = f"/console/v1/experiments/{experiment_id}/pulse"
-            response = await self._client.get(url)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"Retrieved pulse data for experiment {experiment_id}")
-            return {"success": True, "data": data, "error": None}
-        except Exception as e:
-            logger.error(f"Error getting experiment pulse for {experiment_id}: {e}")
-            return {"success": False, "data": {}, "error": str(e)}
-
-    async def get_metric_details(self, metric_id: str, experiment_id: str) -> dict[str, Any]:
+        result = await self._call(
+            "GET",
+            f"{_EXPERIMENTS}/{experiment_id}/pulse",
+            "getting experiment pulse",
+            cache=False,
+            envelope=_RESULT,
+        )
+        if result["success"]:
+            logger.info("Retrieved pulse data for experiment %s", experiment_id)
+        return result
+
+    async def get_metric_details(
+        self, metric_id: str, experiment_id: str
+    ) -> dict[str, Any]:
         """Get detailed metric analysis including statistical significance."""
-        if not self._initialized:
-            raise RuntimeError("Client not initialized. Call initialize() first.")
-        
-        try:
-            url = f"/console/v1/experiments/{experiment_id}/metrics/{metric_id}"
-            response = await self._client.get(url)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"Retrieved metric details for {metric_id} in experiment {experiment_id}")
-            return {"success": True, "data": data, "error": None}
-        except Exception as e:
-            logger.error(f"Error getting metric details for {metric_id} in experiment {experiment_id}: {e}")
-            return {"success": False, "data": {}, "error": str(e)}
-
-    async def export_pulse_report(self, experiment_id: str, format: str = "json") -> dict[str, Any]:
+        result = await self._call(
+            "GET",
+            f"{_EXPERIMENTS}/{experiment_id}/metrics/{metric_id}",
+            "getting metric details",
+            cache=False,
+            envelope=_RESULT,
+        )
+        if result["success"]:
+            logger.info(
+                "Retrieved metric details for %s in experiment %s",
+                metric_id,
+                experiment_id,
+            )
+        return result
+
+    async def export_pulse_report(
+        self, experiment_id: str, format: str = "json"
+    ) -> dict[str, Any]:
         """Export comprehensive pulse report in specified format."""
-        if not self._initialized:
-            raise RuntimeError("Client not initialized. Call initialize() first.")
-        
-        try:
-            url = f"/console/v1/experiments/{experiment_id}/pulse/export"
-            params = {"format": format}
-            response = await self._client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"Exported pulse report for experiment {experiment_id} in {format} format")
-            return {"success": True, "data": data, "error": None}
-        except Exception as e:
-            logger.error(f"Error exporting pulse report for {experiment_id}: {e}")
-            return {"success": False, "data": {}, "error": str(e)}
+        result = await self._call(
+            "GET",
+            f"{_EXPERIMENTS}/{experiment_id}/pulse/export",
+            "exporting pulse report",
+            params={"format": format},
+            cache=False,
+            envelope=_RESULT,
+        )
+        if result["success"]:
+            logger.info(
+                "Exported pulse report for experiment %s in %s format",
+                experiment_id,
+                format,
+            )
+        return result
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop cached responses whose path starts with ``prefix`` (all by default).
+
+        Writes made through this client invalidate on their own; use this
+        after changes made elsewhere, e.g. in the Statsig console. Hooks
+        registered with ``on_invalidate`` are called with ``prefix`` too.
+        """
+        self._cache.invalidate(prefix)
+        for hook in self._invalidate_hooks:
+            hook(prefix)
+
+    def on_invalidate(self, hook: Callable[[str], None]) -> None:
+        """Call ``hook(prefix)`` on every ``invalidate``.
+
+        Lets callers that keep results derived from this client's responses,
+        like the MCP server's tool call cache, drop them as well.
+        """
+        if hook not in self._invalidate_hooks:
+            self._invalidate_hooks.append(hook)
 
     async def shutdown(self) -> None:
         """Shutdown the Console API client."""
+        self._cache.clear()
         if self._client:
-            await self._client.aclose()
+            await _release_client(self._client_key, self._client)
             self._client = None
+            self._client_key = None
         self._initialized = False
         logger.info("Statsig Console API client shutdown")
+
+
+# The process-wide client handed out by get_client()
+_instance: StatsigConsoleClient | None = None
+
+
+async def get_client(api_key: str | None = None) -> StatsigConsoleClient:
+    """Return the process-wide Console API client, initializing it on first use.
+
+    Tool handlers should call this instead of constructing a client per
+    request, so the connection pool and response cache live for the whole
+    session. ``api_key`` only applies when the client is created. Call
+    ``close_client()`` once on shutdown.
+    """
+    global _instance
+    if _instance is None:
+        _instance = StatsigConsoleClient(api_key=api_key)
+    # A no-op once initialized; if initialization fails the next call retries
+    await _instance.initialize()
+    return _instance
+
+
+async def close_client() -> None:
+    """Shut down the process-wide client, if one was created."""
+    global _instance
+    instance, _instance = _instance, None
+    if instance is not None:
+        await instance.shutdown()
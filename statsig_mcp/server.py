@@ -8,14 +8,23 @@ dynamic configurations, experiments, and event logging.
 
 import argparse
 import asyncio
+import functools
+import logging
 import os
 import sys
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple, NoReturn
 
+import jsonschema
+import orjson
+from mcp import types
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
 
-from .console_client import StatsigConsoleClient
+from ._stdio import buffered_stdio_server
+from .console_client import StatsigConsoleClient, close_client, get_client
+
+logger = logging.getLogger(__name__)
 
 # Initialize the MCP server
 server = Server("statsig-mcp")
@@ -24,8 +33,9 @@ server = Server("statsig-mcp")
 statsig_client: StatsigConsoleClient | None = None
 
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command-line arguments."""
+@functools.lru_cache(maxsize=1)
+def _argument_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser; it is the same for every call."""
     parser = argparse.ArgumentParser(
         description="Statsig MCP Server - Model Context Protocol server for Statsig feature flags"
     )
@@ -38,9 +48,19 @@ def parse_arguments() -> argparse.Namespace:
     )
 
     # MCP server options
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug logging (can also use STATSIG_DEBUG=true)",
+    )
     parser.add_argument("--version", action="version", version="%(prog)s 1.0.0")
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    return _argument_parser().parse_args()
 
 
 def get_configuration(args: argparse.Namespace) -> dict[str, Any]:
@@ -53,40 +73,65 @@ def get_configuration(args: argparse.Namespace) -> dict[str, Any]:
             "Provide via --api-key argument or STATSIG_CONSOLE_API_KEY environment variable."
         )
 
-    return {"api_key": api_key}
+    debug = args.debug or os.getenv("STATSIG_DEBUG", "").lower() in ("true", "1")
 
+    return {"api_key": api_key, "debug": debug}
 
-@server.list_tools()
-async def list_tools() -> list[dict]:
-    """List available tools."""
-    return [
+
+def configure_logging(debug: bool = False) -> None:
+    """Log to stderr, which is free while stdout carries the MCP protocol.
+
+    The level is DEBUG when ``debug`` is set and LOG_LEVEL (default WARNING)
+    otherwise, so routine INFO messages are dropped at the level check.
+    """
+    level = "DEBUG" if debug else os.getenv("LOG_LEVEL", "WARNING").upper()
+    logging.basicConfig(
+        level=level,
+        stream=sys.stderr,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+
+# Input schemas shared by several tools
+_NO_ARGUMENTS: dict[str, Any] = {"type": "object", "properties": {}}
+
+
+def _id_schema(key: str, description: str) -> dict[str, Any]:
+    """Input schema for a tool taking a single required id."""
+    return {
+        "type": "object",
+        "properties": {key: {"type": "string", "description": description}},
+        "required": [key],
+    }
+
+
+def _limit_schema(items: str) -> dict[str, Any]:
+    """Input schema for a list tool taking an optional limit."""
+    return {
+        "type": "object",
+        "properties": {
+            "limit": {
+                "type": "number",
+                "description": f"Maximum number of {items} to return",
+            }
+        },
+    }
+
+
+# Tool catalog. The schemas are static, so the Tool models are built once
+# at import and the same list is returned for every tools/list request.
+_TOOLS: list[types.Tool] = [
+    types.Tool(**tool)
+    for tool in [
         {
             "name": "list_gates",
             "description": "List all feature gates",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of gates to return (optional)",
-                    }
-                },
-                "required": [],
-            },
+            "inputSchema": _limit_schema("gates"),
         },
         {
             "name": "get_gate",
             "description": "Get details of a specific feature gate",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "gate_id": {
-                        "type": "string",
-                        "description": "ID of the feature gate",
-                    }
-                },
-                "required": ["gate_id"],
-            },
+            "inputSchema": _id_schema("gate_id", "ID of the feature gate"),
         },
         {
             "name": "create_gate",
@@ -122,15 +167,15 @@ async def list_tools() -> list[dict]:
                     },
                     "name": {
                         "type": "string",
-                        "description": "Name of the feature gate (optional)",
+                        "description": "Name of the feature gate",
                     },
                     "description": {
                         "type": "string",
-                        "description": "Description of the feature gate (optional)",
+                        "description": "Description of the feature gate",
                     },
                     "is_enabled": {
                         "type": "boolean",
-                        "description": "Whether the gate is enabled (optional)",
+                        "description": "Whether the gate is enabled",
                     },
                 },
                 "required": ["gate_id"],
@@ -139,44 +184,17 @@ async def list_tools() -> list[dict]:
         {
             "name": "delete_gate",
             "description": "Delete a feature gate",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "gate_id": {
-                        "type": "string",
-                        "description": "ID of the feature gate",
-                    }
-                },
-                "required": ["gate_id"],
-            },
+            "inputSchema": _id_schema("gate_id", "ID of the feature gate"),
         },
         {
             "name": "list_experiments",
             "description": "List all experiments",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of experiments to return (optional)",
-                    }
-                },
-                "required": [],
-            },
+            "inputSchema": _limit_schema("experiments"),
         },
         {
             "name": "get_experiment",
             "description": "Get details of a specific experiment",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "string",
-                        "description": "ID of the experiment",
-                    }
-                },
-                "required": ["experiment_id"],
-            },
+            "inputSchema": _id_schema("experiment_id", "ID of the experiment"),
         },
         {
             "name": "create_experiment",
@@ -191,7 +209,7 @@ async def list_tools() -> list[dict]:
                     },
                     "hypothesis": {
                         "type": "string",
-                        "description": "Experiment hypothesis (optional)",
+                        "description": "Experiment hypothesis",
                     },
                 },
                 "required": ["name"],
@@ -209,15 +227,15 @@ async def list_tools() -> list[dict]:
                     },
                     "name": {
                         "type": "string",
-                        "description": "Name of the experiment (optional)",
+                        "description": "Name of the experiment",
                     },
                     "description": {
                         "type": "string",
-                        "description": "Description of the experiment (optional)",
+                        "description": "Description of the experiment",
                     },
                     "hypothesis": {
                         "type": "string",
-                        "description": "Experiment hypothesis (optional)",
+                        "description": "Experiment hypothesis",
                     },
                 },
                 "required": ["experiment_id"],
@@ -226,44 +244,17 @@ async def list_tools() -> list[dict]:
         {
             "name": "delete_experiment",
             "description": "Delete an experiment",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "string",
-                        "description": "ID of the experiment",
-                    }
-                },
-                "required": ["experiment_id"],
-            },
+            "inputSchema": _id_schema("experiment_id", "ID of the experiment"),
         },
         {
             "name": "list_dynamic_configs",
             "description": "List all dynamic configs",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of configs to return (optional)",
-                    }
-                },
-                "required": [],
-            },
+            "inputSchema": _limit_schema("configs"),
         },
         {
             "name": "get_dynamic_config",
             "description": "Get details of a specific dynamic config",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "config_id": {
-                        "type": "string",
-                        "description": "ID of the dynamic config",
-                    }
-                },
-                "required": ["config_id"],
-            },
+            "inputSchema": _id_schema("config_id", "ID of the dynamic config"),
         },
         {
             "name": "create_dynamic_config",
@@ -295,11 +286,11 @@ async def list_tools() -> list[dict]:
                     },
                     "name": {
                         "type": "string",
-                        "description": "Name of the dynamic config (optional)",
+                        "description": "Name of the dynamic config",
                     },
                     "description": {
                         "type": "string",
-                        "description": "Description of the dynamic config (optional)",
+                        "description": "Description of the dynamic config",
                     },
                 },
                 "required": ["config_id"],
@@ -308,41 +299,17 @@ async def list_tools() -> list[dict]:
         {
             "name": "delete_dynamic_config",
             "description": "Delete a dynamic config",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "config_id": {
-                        "type": "string",
-                        "description": "ID of the dynamic config",
-                    }
-                },
-                "required": ["config_id"],
-            },
+            "inputSchema": _id_schema("config_id", "ID of the dynamic config"),
         },
         {
             "name": "list_segments",
             "description": "List all segments",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of segments to return (optional)",
-                    }
-                },
-                "required": [],
-            },
+            "inputSchema": _limit_schema("segments"),
         },
         {
             "name": "get_segment",
             "description": "Get details of a specific segment",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "segment_id": {"type": "string", "description": "ID of the segment"}
-                },
-                "required": ["segment_id"],
-            },
+            "inputSchema": _id_schema("segment_id", "ID of the segment"),
         },
         {
             "name": "create_segment",
@@ -362,27 +329,12 @@ async def list_tools() -> list[dict]:
         {
             "name": "list_metrics",
             "description": "List all metrics",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of metrics to return (optional)",
-                    }
-                },
-                "required": [],
-            },
+            "inputSchema": _limit_schema("metrics"),
         },
         {
             "name": "get_metric",
             "description": "Get details of a specific metric",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "metric_id": {"type": "string", "description": "ID of the metric"}
-                },
-                "required": ["metric_id"],
-            },
+            "inputSchema": _id_schema("metric_id", "ID of the metric"),
         },
         {
             "name": "list_audit_logs",
@@ -396,36 +348,29 @@ async def list_tools() -> list[dict]:
                     },
                     "from_date": {
                         "type": "string",
-                        "description": "Start date for logs (YYYY-MM-DD format, optional)",
+                        "description": "Start date for logs (YYYY-MM-DD format)",
                     },
                     "to_date": {
                         "type": "string",
-                        "description": "End date for logs (YYYY-MM-DD format, optional)",
+                        "description": "End date for logs (YYYY-MM-DD format)",
                     },
                 },
-                "required": [],
             },
         },
         {
             "name": "list_target_apps",
             "description": "List all target apps",
-            "inputSchema": {"type": "object", "properties": {}, "required": []},
+            "inputSchema": _NO_ARGUMENTS,
         },
         {
             "name": "get_target_app",
             "description": "Get details of a specific target app",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "app_id": {"type": "string", "description": "ID of the target app"}
-                },
-                "required": ["app_id"],
-            },
+            "inputSchema": _id_schema("app_id", "ID of the target app"),
         },
         {
             "name": "list_api_keys",
             "description": "List all API keys",
-            "inputSchema": {"type": "object", "properties": {}, "required": []},
+            "inputSchema": _NO_ARGUMENTS,
         },
         {
             "name": "query_events",
@@ -435,34 +380,24 @@ async def list_tools() -> list[dict]:
                 "properties": {
                     "event_name": {
                         "type": "string",
-                        "description": "Specific event name to query (optional - if not provided, lists all events)",
+                        "description": "Event name to query; lists all events when omitted",
                     },
                     "limit": {
                         "type": "number",
                         "description": "Maximum number of events to return (default: 10)",
                     },
                 },
-                "required": [],
             },
         },
         {
             "name": "get_user_by_email",
             "description": "Get team member info by email using Console API",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "email": {
-                        "type": "string",
-                        "description": "Email address of team member",
-                    }
-                },
-                "required": ["email"],
-            },
+            "inputSchema": _id_schema("email", "Email address of team member"),
         },
         {
             "name": "list_team_users",
             "description": "List all team members using Console API",
-            "inputSchema": {"type": "object", "properties": {}, "required": []},
+            "inputSchema": _NO_ARGUMENTS,
         },
         # Experiment Results and Analytics
         {
@@ -477,7 +412,7 @@ async def list_tools() -> list[dict]:
                     },
                     "include_metrics": {
                         "type": "boolean",
-                        "description": "Include detailed metric breakdowns (optional, default: true)",
+                        "description": "Include detailed metric breakdowns",
                         "default": True,
                     },
                 },
@@ -487,16 +422,9 @@ async def list_tools() -> list[dict]:
         {
             "name": "get_experiment_pulse", 
             "description": "Get experiment pulse data with health metrics and performance indicators",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "string",
-                        "description": "ID of the experiment to get pulse data for",
-                    },
-                },
-                "required": ["experiment_id"],
-            },
+            "inputSchema": _id_schema(
+                "experiment_id", "ID of the experiment to get pulse data for"
+            ),
         },
         {
             "name": "get_metric_details",
@@ -537,298 +465,426 @@ async def list_tools() -> list[dict]:
             },
         },
     ]
+]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[dict]:
-    """Handle tool calls."""
-    global statsig_client
+# A validator per tool, built once from its input schema. The MCP server's
+# own input validation builds a fresh validator, and checks the schema
+# itself, on every call, so it is turned off in favor of these.
+_VALIDATORS = {
+    tool.name: jsonschema.validators.validator_for(tool.inputSchema)(
+        tool.inputSchema
+    )
+    for tool in _TOOLS
+}
 
+
+@server.list_tools()
+async def list_tools() -> list[types.Tool]:
+    """List available tools."""
+    return _TOOLS
+
+
+# Tool handlers. Each takes the Console API client and the tool arguments
+# and returns the text shown to the MCP client.
+_ToolHandler = Callable[[StatsigConsoleClient, dict], Awaitable[str]]
+
+
+# The list, get, update and delete tools differ only in the client method,
+# the id argument and the label, so their handlers are built from these.
+def _lister(method: str, label: str) -> _ToolHandler:
+    """Handler for a list tool taking an optional limit."""
+
+    async def handler(client: StatsigConsoleClient, arguments: dict) -> str:
+        result = await getattr(client, method)(arguments.get("limit"))
+        return _format_list_result(result, label)
+
+    return handler
+
+
+def _getter(method: str, id_key: str, label: str) -> _ToolHandler:
+    """Handler for a tool that fetches one item by id."""
+
+    async def handler(client: StatsigConsoleClient, arguments: dict) -> str:
+        item_id = arguments[id_key]
+        result = await getattr(client, method)(item_id)
+        return _format_item_result(result, label, item_id)
+
+    return handler
+
+
+def _updater(method: str, id_key: str, label: str) -> _ToolHandler:
+    """Handler for a tool that updates one item with the other arguments."""
+
+    async def handler(client: StatsigConsoleClient, arguments: dict) -> str:
+        updates = arguments.copy()
+        item_id = updates.pop(id_key)
+        result = await getattr(client, method)(item_id, updates)
+        return _format_write_result(result, "update", f"{label} {item_id}")
+
+    return handler
+
+
+def _deleter(method: str, id_key: str, label: str) -> _ToolHandler:
+    """Handler for a tool that deletes one item by id."""
+
+    async def handler(client: StatsigConsoleClient, arguments: dict) -> str:
+        item_id = arguments[id_key]
+        result = await getattr(client, method)(item_id)
+        return _format_write_result(result, "delete", f"{label} {item_id}")
+
+    return handler
+
+
+# Creates take resource-specific fields
+async def _create_gate(client: StatsigConsoleClient, arguments: dict) -> str:
+    name = arguments["name"]
+    description = arguments.get("description", "")
+    is_enabled = arguments.get("is_enabled", False)
+    result = await client.create_gate(name, description, is_enabled)
+    return _format_write_result(result, "create", f"Feature Gate '{name}'")
+
+
+async def _create_experiment(client: StatsigConsoleClient, arguments: dict) -> str:
+    name = arguments["name"]
+    description = arguments.get("description", "")
+    hypothesis = arguments.get("hypothesis")
+    result = await client.create_experiment(name, description, hypothesis)
+    return _format_write_result(result, "create", f"Experiment '{name}'")
+
+
+async def _create_dynamic_config(
+    client: StatsigConsoleClient, arguments: dict
+) -> str:
+    name = arguments["name"]
+    description = arguments.get("description", "")
+    result = await client.create_dynamic_config(name, description)
+    return _format_write_result(result, "create", f"Dynamic Config '{name}'")
+
+
+async def _create_segment(client: StatsigConsoleClient, arguments: dict) -> str:
+    name = arguments["name"]
+    description = arguments.get("description", "")
+    result = await client.create_segment(name, description)
+    return _format_write_result(result, "create", f"Segment '{name}'")
+
+
+# Audit Logs
+async def _list_audit_logs(client: StatsigConsoleClient, arguments: dict) -> str:
+    result = await client.list_audit_logs(
+        arguments.get("limit", 20), arguments.get("from_date"), arguments.get("to_date")
+    )
+    return _format_audit_logs_result(result)
+
+
+# Target Apps
+async def _list_target_apps(client: StatsigConsoleClient, arguments: dict) -> str:
+    result = await client.list_target_apps()
+    return _format_list_result(result, "Target Apps")
+
+
+# API Keys
+async def _list_api_keys(client: StatsigConsoleClient, arguments: dict) -> str:
+    result = await client.list_api_keys()
+    return _format_list_result(result, "API Keys")
+
+
+# Events
+async def _query_events(client: StatsigConsoleClient, arguments: dict) -> str:
+    result = await client.query_events(
+        arguments.get("event_name"), arguments.get("limit", 10)
+    )
+    return _format_events_query_result(result)
+
+
+# Users
+async def _get_user_by_email(client: StatsigConsoleClient, arguments: dict) -> str:
+    result = await client.get_user_by_email(arguments["email"])
+    return _format_user_result(result)
+
+
+async def _list_team_users(client: StatsigConsoleClient, arguments: dict) -> str:
+    result = await client.list_team_users()
+    return _format_team_users_result(result)
+
+
+# Experiment Results and Analytics
+async def _get_experiment_results(
+    client: StatsigConsoleClient, arguments: dict
+) -> str:
+    result = await client.get_experiment_results(
+        arguments["experiment_id"], arguments.get("include_metrics", True)
+    )
+    return _format_experiment_results(result)
+
+
+async def _get_experiment_pulse(client: StatsigConsoleClient, arguments: dict) -> str:
+    result = await client.get_experiment_pulse(arguments["experiment_id"])
+    return _format_pulse_data(result)
+
+
+async def _get_metric_details(client: StatsigConsoleClient, arguments: dict) -> str:
+    result = await client.get_metric_details(
+        arguments["metric_id"], arguments["experiment_id"]
+    )
+    return _format_metric_details(result)
+
+
+async def _export_pulse_report(client: StatsigConsoleClient, arguments: dict) -> str:
+    format_type = arguments.get("format", "json")
+    result = await client.export_pulse_report(arguments["experiment_id"], format_type)
+    return _format_pulse_report(result, format_type)
+
+
+class _Tool(NamedTuple):
+    """A tool's handler and how its results may be reused.
+
+    ``reuse`` is "cache" for reads whose successful results are kept for a
+    few seconds, "share" for reads that only share calls in flight (those
+    the client fetches with ``cache=False``), and "write" for tools that
+    change something and so clear every kept result.
+    """
+
+    handler: _ToolHandler
+    reuse: str
+
+
+# Tool name -> handler and reuse policy
+_TOOL_HANDLERS: dict[str, _Tool] = {
+    "list_gates": _Tool(_lister("list_gates", "Feature Gates"), "cache"),
+    "get_gate": _Tool(_getter("get_gate", "gate_id", "Feature Gate"), "cache"),
+    "create_gate": _Tool(_create_gate, "write"),
+    "update_gate": _Tool(_updater("update_gate", "gate_id", "Feature Gate"), "write"),
+    "delete_gate": _Tool(_deleter("delete_gate", "gate_id", "Feature Gate"), "write"),
+    "list_experiments": _Tool(_lister("list_experiments", "Experiments"), "cache"),
+    "get_experiment": _Tool(
+        _getter("get_experiment", "experiment_id", "Experiment"),
+        "cache",
+    ),
+    "create_experiment": _Tool(_create_experiment, "write"),
+    "update_experiment": _Tool(
+        _updater("update_experiment", "experiment_id", "Experiment"),
+        "write",
+    ),
+    "delete_experiment": _Tool(
+        _deleter("delete_experiment", "experiment_id", "Experiment"),
+        "write",
+    ),
+    "list_dynamic_configs": _Tool(
+        _lister("list_dynamic_configs", "Dynamic Configs"),
+        "cache",
+    ),
+    "get_dynamic_config": _Tool(
+        _getter("get_dynamic_config", "config_id", "Dynamic Config"),
+        "cache",
+    ),
+    "create_dynamic_config": _Tool(_create_dynamic_config, "write"),
+    "update_dynamic_config": _Tool(
+        _updater("update_dynamic_config", "config_id", "Dynamic Config"),
+        "write",
+    ),
+    "delete_dynamic_config": _Tool(
+        _deleter("delete_dynamic_config", "config_id", "Dynamic Config"),
+        "write",
+    ),
+    "list_segments": _Tool(_lister("list_segments", "Segments"), "cache"),
+    "get_segment": _Tool(_getter("get_segment", "segment_id", "Segment"), "cache"),
+    "create_segment": _Tool(_create_segment, "write"),
+    "list_metrics": _Tool(_lister("list_metrics", "Metrics"), "cache"),
+    "get_metric": _Tool(_getter("get_metric", "metric_id", "Metric"), "cache"),
+    "list_audit_logs": _Tool(_list_audit_logs, "cache"),
+    "list_target_apps": _Tool(_list_target_apps, "cache"),
+    "get_target_app": _Tool(_getter("get_target_app", "app_id", "Target App"), "cache"),
+    "list_api_keys": _Tool(_list_api_keys, "cache"),
+    "query_events": _Tool(_query_events, "cache"),
+    "get_user_by_email": _Tool(_get_user_by_email, "cache"),
+    "list_team_users": _Tool(_list_team_users, "cache"),
+    "get_experiment_results": _Tool(_get_experiment_results, "share"),
+    "get_experiment_pulse": _Tool(_get_experiment_pulse, "share"),
+    "get_metric_details": _Tool(_get_metric_details, "share"),
+    "export_pulse_report": _Tool(_export_pulse_report, "share"),
+}
+
+
+# (tool name, arguments as JSON with sorted keys)
+_CallKey = tuple[str, bytes]
+
+# A tool call's response content
+_Content = list[types.TextContent]
+
+
+class _ToolCallCache:
+    """Recent and in-flight results of read-only tool calls.
+
+    Identical calls made while one is running share its result, and a
+    successful result is reused for ``ttl`` seconds. Any write through the
+    server clears everything, so reads never outlive a change made here.
+    Cached content is returned as is; the MCP server copies the list and
+    doesn't modify the TextContent models.
+    """
+
+    def __init__(self, ttl: float = 5.0, max_entries: int = 1024) -> None:
+        self._ttl_ns = int(ttl * 1_000_000_000)
+        self._max_entries = max_entries
+        # key -> (expires_at in time.monotonic_ns(), content), oldest first
+        self._entries: dict[_CallKey, tuple[int, _Content]] = {}
+        # key -> call currently running
+        self._inflight: dict[_CallKey, asyncio.Task] = {}
+        # Bumped on clear() so calls started earlier don't store
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Token to pass to ``store``; it changes on every ``clear()``."""
+        return self._generation
+
+    def inflight(self, key: _CallKey) -> asyncio.Task | None:
+        """Return the call currently running for ``key``, if any."""
+        return self._inflight.get(key)
+
+    def share(self, key: _CallKey, task: asyncio.Task) -> None:
+        """Let identical calls join ``task`` until it finishes."""
+        inflight = self._inflight
+        inflight[key] = task
+
+        def _done(task: asyncio.Task) -> None:
+            if inflight.get(key) is task:
+                del inflight[key]
+
+        task.add_done_callback(_done)
+
+    def lookup(self, key: _CallKey) -> _Content | None:
+        """Return the cached content for ``key`` if it hasn't expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic_ns() >= entry[0]:
+            return None
+        return entry[1]
+
+    def store(self, key: _CallKey, content: _Content, generation: int) -> None:
+        """Cache ``content`` unless the cache was cleared since ``generation``."""
+        if generation != self._generation:
+            return
+        entries = self._entries
+        entries.pop(key, None)
+        entries[key] = (time.monotonic_ns() + self._ttl_ns, content)
+        if len(entries) > self._max_entries:
+            del entries[next(iter(entries))]
+
+    def clear(self) -> None:
+        """Drop cached results; running calls finish but aren't shared or kept."""
+        self._generation += 1
+        self._entries.clear()
+        self._inflight.clear()
+
+
+_tool_calls = _ToolCallCache()
+
+
+def _drop_tool_calls(prefix: str) -> None:
+    """Drop every kept tool result when the client's cache is invalidated."""
+    _tool_calls.clear()
+
+
+async def _run_tool(
+    name: str, handler: _ToolHandler, arguments: dict
+) -> tuple[str, bool]:
+    """Run a tool handler, returning ``(text, succeeded)``.
+
+    Failures are turned into the response text. The formatters report API
+    errors as text starting with ❌, which also counts as a failure.
+    """
+    try:
+        text = await handler(statsig_client, arguments)
+    except Exception as e:
+        return f"Error calling tool {name}: {str(e)}", False
+    return text, not text.startswith("❌")
+
+
+async def _run_shared(
+    key: _CallKey, name: str, tool: _Tool, arguments: dict
+) -> _Content:
+    """Run a read-only tool call and cache its content if it succeeded."""
+    generation = _tool_calls.generation
+    text, succeeded = await _run_tool(name, tool.handler, arguments)
+    content = [types.TextContent(type="text", text=text)]
+    if succeeded and tool.reuse == "cache":
+        _tool_calls.store(key, content, generation)
+    return content
+
+
+def _start_shared_call(
+    key: _CallKey, name: str, tool: _Tool, arguments: dict
+) -> asyncio.Task:
+    """Return the running call for ``key``, starting it if needed."""
+    task = _tool_calls.inflight(key)
+    if task is None:
+        task = asyncio.create_task(_run_shared(key, name, tool, arguments))
+        _tool_calls.share(key, task)
+    return task
+
+
+@server.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: dict) -> _Content | types.CallToolResult:
+    """Handle tool calls."""
     if not statsig_client:
-        return [{"type": "text", "text": "Error: Statsig client not initialized"}]
+        return [
+            types.TextContent(type="text", text="Error: Statsig client not initialized")
+        ]
+
+    tool = _TOOL_HANDLERS.get(name)
+    if tool is None:
+        return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
 
     try:
-        # Gates
-        if name == "list_gates":
-            limit = arguments.get("limit")
-            result = await statsig_client.list_gates(limit)
-            return [
-                {"type": "text", "text": _format_list_result(result, "Feature Gates")}
-            ]
-
-        elif name == "get_gate":
-            gate_id = arguments["gate_id"]
-            result = await statsig_client.get_gate(gate_id)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_item_result(result, "Feature Gate", gate_id),
-                }
-            ]
-
-        elif name == "create_gate":
-            name_val = arguments["name"]
-            description = arguments.get("description", "")
-            is_enabled = arguments.get("is_enabled", False)
-            result = await statsig_client.create_gate(name_val, description, is_enabled)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_create_result(result, "Feature Gate", name_val),
-                }
-            ]
-
-        elif name == "update_gate":
-            gate_id = arguments["gate_id"]
-            updates = {k: v for k, v in arguments.items() if k != "gate_id"}
-            result = await statsig_client.update_gate(gate_id, updates)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_update_result(result, "Feature Gate", gate_id),
-                }
-            ]
-
-        elif name == "delete_gate":
-            gate_id = arguments["gate_id"]
-            result = await statsig_client.delete_gate(gate_id)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_delete_result(result, "Feature Gate", gate_id),
-                }
-            ]
-
-        # Experiments
-        elif name == "list_experiments":
-            limit = arguments.get("limit")
-            result = await statsig_client.list_experiments(limit)
-            return [
-                {"type": "text", "text": _format_list_result(result, "Experiments")}
-            ]
-
-        elif name == "get_experiment":
-            experiment_id = arguments["experiment_id"]
-            result = await statsig_client.get_experiment(experiment_id)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_item_result(result, "Experiment", experiment_id),
-                }
-            ]
-
-        elif name == "create_experiment":
-            name_val = arguments["name"]
-            description = arguments.get("description", "")
-            hypothesis = arguments.get("hypothesis")
-            result = await statsig_client.create_experiment(
-                name_val, description, hypothesis
+        _VALIDATORS[name].validate(arguments)
+    except jsonschema.ValidationError as e:
+        text = f"Input validation error: {e.message}"
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=text)], isError=True
+        )
+
+    if tool.reuse != "write":
+        key = (name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+        content = _tool_calls.lookup(key)
+        if content is None:
+            # Shielded so one caller going away doesn't cancel the others'
+            content = await asyncio.shield(
+                _start_shared_call(key, name, tool, arguments)
             )
-            return [
-                {
-                    "type": "text",
-                    "text": _format_create_result(result, "Experiment", name_val),
-                }
-            ]
-
-        elif name == "update_experiment":
-            experiment_id = arguments["experiment_id"]
-            updates = {k: v for k, v in arguments.items() if k != "experiment_id"}
-            result = await statsig_client.update_experiment(experiment_id, updates)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_update_result(result, "Experiment", experiment_id),
-                }
-            ]
-
-        elif name == "delete_experiment":
-            experiment_id = arguments["experiment_id"]
-            result = await statsig_client.delete_experiment(experiment_id)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_delete_result(result, "Experiment", experiment_id),
-                }
-            ]
-
-        # Dynamic Configs
-        elif name == "list_dynamic_configs":
-            limit = arguments.get("limit")
-            result = await statsig_client.list_dynamic_configs(limit)
-            return [
-                {"type": "text", "text": _format_list_result(result, "Dynamic Configs")}
-            ]
-
-        elif name == "get_dynamic_config":
-            config_id = arguments["config_id"]
-            result = await statsig_client.get_dynamic_config(config_id)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_item_result(result, "Dynamic Config", config_id),
-                }
-            ]
-
-        elif name == "create_dynamic_config":
-            name_val = arguments["name"]
-            description = arguments.get("description", "")
-            result = await statsig_client.create_dynamic_config(name_val, description)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_create_result(result, "Dynamic Config", name_val),
-                }
-            ]
-
-        elif name == "update_dynamic_config":
-            config_id = arguments["config_id"]
-            updates = {k: v for k, v in arguments.items() if k != "config_id"}
-            result = await statsig_client.update_dynamic_config(config_id, updates)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_update_result(result, "Dynamic Config", config_id),
-                }
-            ]
-
-        elif name == "delete_dynamic_config":
-            config_id = arguments["config_id"]
-            result = await statsig_client.delete_dynamic_config(config_id)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_delete_result(result, "Dynamic Config", config_id),
-                }
-            ]
-
-        # Segments
-        elif name == "list_segments":
-            limit = arguments.get("limit")
-            result = await statsig_client.list_segments(limit)
-            return [{"type": "text", "text": _format_list_result(result, "Segments")}]
-
-        elif name == "get_segment":
-            segment_id = arguments["segment_id"]
-            result = await statsig_client.get_segment(segment_id)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_item_result(result, "Segment", segment_id),
-                }
-            ]
-
-        elif name == "create_segment":
-            name_val = arguments["name"]
-            description = arguments.get("description", "")
-            result = await statsig_client.create_segment(name_val, description)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_create_result(result, "Segment", name_val),
-                }
-            ]
-
-        # Metrics
-        elif name == "list_metrics":
-            limit = arguments.get("limit")
-            result = await statsig_client.list_metrics(limit)
-            return [{"type": "text", "text": _format_list_result(result, "Metrics")}]
-
-        elif name == "get_metric":
-            metric_id = arguments["metric_id"]
-            result = await statsig_client.get_metric(metric_id)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_item_result(result, "Metric", metric_id),
-                }
-            ]
-
-        # Audit Logs
-        elif name == "list_audit_logs":
-            limit = arguments.get("limit", 20)
-            from_date = arguments.get("from_date")
-            to_date = arguments.get("to_date")
-            result = await statsig_client.list_audit_logs(limit, from_date, to_date)
-            return [{"type": "text", "text": _format_audit_logs_result(result)}]
-
-        # Target Apps
-        elif name == "list_target_apps":
-            result = await statsig_client.list_target_apps()
-            return [
-                {"type": "text", "text": _format_list_result(result, "Target Apps")}
-            ]
-
-        elif name == "get_target_app":
-            app_id = arguments["app_id"]
-            result = await statsig_client.get_target_app(app_id)
-            return [
-                {
-                    "type": "text",
-                    "text": _format_item_result(result, "Target App", app_id),
-                }
-            ]
-
-        # API Keys
-        elif name == "list_api_keys":
-            result = await statsig_client.list_api_keys()
-            return [{"type": "text", "text": _format_list_result(result, "API Keys")}]
-
-        # Events (keeping existing functionality)
-        elif name == "query_events":
-            event_name = arguments.get("event_name")
-            limit = arguments.get("limit", 10)
-            result = await statsig_client.query_events(event_name, limit)
-            return [{"type": "text", "text": _format_events_query_result(result)}]
-
-        # Users (keeping existing functionality)
-        elif name == "get_user_by_email":
-            email = arguments["email"]
-            result = await statsig_client.get_user_by_email(email)
-            return [{"type": "text", "text": _format_user_result(result)}]
-
-        elif name == "list_team_users":
-            result = await statsig_client.list_team_users()
-            return [{"type": "text", "text": _format_team_users_result(result)}]
+        return content
 
-        # Experiment Results and Analytics
-        elif name == "get_experiment_results":
-            experiment_id = arguments["experiment_id"]
-            include_metrics = arguments.get("include_metrics", True)
-            result = await statsig_client.get_experiment_results(experiment_id, include_metrics)
-            return [{"type": "text", "text": _format_experiment_results(result)}]
-
-        elif name == "get_experiment_pulse":
-            experiment_id = arguments["experiment_id"]
-            result = await statsig_client.get_experiment_pulse(experiment_id)
-            return [{"type": "text", "text": _format_pulse_data(result)}]
-
-        elif name == "get_metric_details":
-            metric_id = arguments["metric_id"]
-            experiment_id = arguments["experiment_id"]
-            result = await statsig_client.get_metric_details(metric_id, experiment_id)
-            return [{"type": "text", "text": _format_metric_details(result)}]
-
-        elif name == "export_pulse_report":
-            experiment_id = arguments["experiment_id"]
-            format_type = arguments.get("format", "json")
-            result = await statsig_client.export_pulse_report(experiment_id, format_type)
-            return [{"type": "text", "text": _format_pulse_report(result, format_type)}]
+    # Drop results from before this write, including reads in flight, and
+    # again after it for reads that ran while it was being applied
+    _tool_calls.clear()
+    text, _ = await _run_tool(name, tool.handler, arguments)
+    _tool_calls.clear()
+    return [types.TextContent(type="text", text=text)]
 
-        else:
-            return [{"type": "text", "text": f"Unknown tool: {name}"}]
 
-    except Exception as e:
-        return [{"type": "text", "text": f"Error calling tool {name}: {str(e)}"}]
+def _pick(data: dict, *keys: str, default: Any = "Unknown") -> Any:
+    """Return the value of the first of ``keys`` present in ``data``.
 
+    Like nested ``dict.get`` calls with fallbacks, but the fallbacks are
+    only looked up when the earlier keys are missing.
+    """
+    for key in keys:
+        if key in data:
+            return data[key]
+    return default
 
-def _format_events_query_result(result: dict) -> str:
-    """Format events query result for display."""
-    error = result.get("error")
 
+def _error_text(result: dict, action: str) -> str | None:
+    """Return the error message for a failed Console API call, or None."""
+    error = result.get("error")
     if error:
-        return f"❌ Error querying events: {error}"
+        return f"❌ Error {action}: {error}"
+    return None
+
+
+def _format_events_query_result(result: dict) -> str:
+    """Format events query result for display."""
+    if failed := _error_text(result, "querying events"):
+        return failed
 
     # Check if it's a specific event query
     if "event_name" in result:
@@ -842,9 +898,7 @@ def _format_events_query_result(result: dict) -> str:
         details = result.get("details", {})
         output = [f"📊 Event Details: {event_name}"]
 
-        if details:
-            for key, value in details.items():
-                output.append(f"   {key}: {value}")
+        output.extend(f"   {key}: {value}" for key, value in details.items())
 
         return "\n".join(output)
 
@@ -860,11 +914,11 @@ def _format_events_query_result(result: dict) -> str:
 
     output.append("")
 
-    for event in event_types:
-        name = event.get("name", "Unknown")
-        description = event.get("description", "No description")
-        output.append(f"🔹 {name}")
-        output.append(f"   Description: {description}")
+    output.extend(
+        f"🔹 {event.get('name', 'Unknown')}\n"
+        f"   Description: {event.get('description', 'No description')}"
+        for event in event_types
+    )
 
     return "\n".join(output)
 
@@ -873,10 +927,9 @@ def _format_user_result(result: dict) -> str:
     """Format user result for display."""
     email = result.get("email", "Unknown")
     found = result.get("found", False)
-    error = result.get("error")
 
-    if error:
-        return f"❌ Error getting user {email}: {error}"
+    if failed := _error_text(result, f"getting user {email}"):
+        return failed
 
     if not found:
         message = result.get("message", f"User '{email}' not found")
@@ -892,21 +945,18 @@ def _format_user_result(result: dict) -> str:
 
     output.append("")
 
-    if user_data:
-        # Show key user information
-        for key, value in user_data.items():
-            if key not in ["email"]:  # Don't repeat email
-                output.append(f"   {key}: {value}")
+    # Show key user information, without repeating the email
+    output.extend(
+        f"   {key}: {value}" for key, value in user_data.items() if key != "email"
+    )
 
     return "\n".join(output)
 
 
 def _format_team_users_result(result: dict) -> str:
     """Format team users result for display."""
-    error = result.get("error")
-
-    if error:
-        return f"❌ Error listing team users: {error}"
+    if failed := _error_text(result, "listing team users"):
+        return failed
 
     team_users = result.get("team_users", [])
     total_users = result.get("total_users", 0)
@@ -918,14 +968,12 @@ def _format_team_users_result(result: dict) -> str:
         output.append(f"ℹ️  {note}")
 
     output.append("")
-
-    for user in team_users:
-        email = user.get("email", "Unknown")
-        name = user.get("name", user.get("firstName", "Unknown"))
-        role = user.get("role", "Unknown")
-
-        output.append(f"👤 {name} ({email})")
-        output.append(f"   Role: {role}")
+    output.extend(
+        f"👤 {_pick(user, 'name', 'firstName')}"
+        f" ({user.get('email', 'Unknown')})\n"
+        f"   Role: {user.get('role', 'Unknown')}"
+        for user in team_users
+    )
 
     return "\n".join(output)
 
@@ -933,19 +981,21 @@ def _format_team_users_result(result: dict) -> str:
 async def initialize_client(config: dict[str, Any]) -> None:
     """Initialize the Statsig client with configuration."""
     global statsig_client
-
-    # Set environment variables from config for the client
-    os.environ["STATSIG_CONSOLE_API_KEY"] = config["api_key"]
-
-    statsig_client = StatsigConsoleClient()
-    await statsig_client.initialize()
+    statsig_client = await get_client(config["api_key"])
+    statsig_client.on_invalidate(_drop_tool_calls)
 
 
 async def cleanup() -> None:
     """Cleanup resources."""
     global statsig_client
-    if statsig_client:
-        await statsig_client.shutdown()
+    statsig_client = None
+    await close_client()
+
+
+def _die(error: Exception) -> NoReturn:
+    """Report a fatal error on stderr and exit with status 1."""
+    sys.stderr.write(f"Error: {error}\n")
+    sys.exit(1)
 
 
 async def main() -> None:
@@ -956,12 +1006,17 @@ async def main() -> None:
 
         # Get configuration
         config = get_configuration(args)
+        configure_logging(config["debug"])
+
+        # Optionally pin to one CPU (STATSIG_MCP_CPU); threads started
+        # after this, like the stdio reader, inherit the affinity
+        pin_cpu()
 
         # Initialize Statsig client
         await initialize_client(config)
 
         # Run the MCP server
-        async with stdio_server() as (read_stream, write_stream):
+        async with buffered_stdio_server() as (read_stream, write_stream):
             await server.run(
                 read_stream, write_stream, server.create_initialization_options()
             )
@@ -969,21 +1024,57 @@ async def main() -> None:
     except KeyboardInterrupt:
         pass
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        _die(e)
     finally:
         await cleanup()
 
 
+def use_uvloop() -> bool:
+    """Run asyncio on uvloop when it is installed, returning whether it is.
+
+    uvloop is an optional dependency (the ``uvloop`` extra) and does not
+    support Windows, where the default event loop is kept.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def pin_cpu() -> int | None:
+    """Pin the process to the CPU named by ``STATSIG_MCP_CPU``, if set.
+
+    Off by default. Keeping the event loop on one core avoids migrations
+    between caches; pick a core on the same NUMA node as the client that
+    spawns the server. Returns the pinned CPU, or None.
+    """
+    cpu = os.getenv("STATSIG_MCP_CPU")
+    if not cpu or not hasattr(os, "sched_setaffinity"):
+        return None
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+    except (ValueError, OSError) as e:
+        logger.warning("Ignoring STATSIG_MCP_CPU=%r: %s", cpu, e)
+        return None
+    return int(cpu)
+
+
 def main_sync() -> None:
-    """Synchronous entry point for console scripts."""
+    """Synchronous entry point for console scripts and ``python -m``."""
+    # Use libuv's event loop for the stdio transport when it is installed
+    use_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        sys.exit(0)
+        # Skip interpreter finalization, which can stall stdio shutdown
+        os._exit(0)
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        _die(e)
 
 
 # Entry point is handled by __main__.py when running as module
@@ -991,12 +1082,10 @@ def main_sync() -> None:
 
 def _format_list_result(result: dict, resource_type: str) -> str:
     """Format list result for display."""
-    error = result.get("error")
+    if failed := _error_text(result, f"listing {resource_type}"):
+        return failed
 
-    if error:
-        return f"❌ Error listing {resource_type}: {error}"
-
-    items = result.get("data", result.get("items", []))
+    items = _pick(result, "data", "items", default=[])
     total = result.get("total", len(items))
 
     output = [f"📋 {resource_type} ({total} found)"]
@@ -1006,32 +1095,57 @@ def _format_list_result(result: dict, resource_type: str) -> str:
         return "\n".join(output)
 
     output.append("")
-    for item in items:
-        name = item.get("name", item.get("id", "Unknown"))
-        item_id = item.get("id", item.get("name", "Unknown"))
-        description = item.get("description", "No description")
-        status = item.get("status", item.get("isEnabled", "Unknown"))
-
-        output.append(f"🔹 {name} (ID: {item_id})")
-        if description and description != "No description":
-            output.append(f"   Description: {description}")
-        if str(status).lower() in ["true", "active", "enabled"]:
-            output.append(f"   Status: ✅ {status}")
-        elif str(status).lower() in ["false", "inactive", "disabled"]:
-            output.append(f"   Status: ❌ {status}")
-        else:
-            output.append(f"   Status: {status}")
-        output.append("")
+    output.extend(_format_list_item(item) for item in items)
 
     return "\n".join(output)
 
 
+# Status values (lowercased) shown with an on/off marker in list results
+_STATUS_MARKERS = {
+    **dict.fromkeys(("true", "active", "enabled"), "✅ "),
+    **dict.fromkeys(("false", "inactive", "disabled"), "❌ "),
+}
+
+
+def _format_list_item(item: dict) -> str:
+    """Format one item of a list result as a block of lines."""
+    name = _pick(item, "name", "id")
+    item_id = _pick(item, "id", "name")
+    description = item.get("description", "No description")
+    status = _pick(item, "status", "isEnabled")
+
+    block = f"🔹 {name} (ID: {item_id})\n"
+    if description and description != "No description":
+        block += f"   Description: {description}\n"
+    marker = _STATUS_MARKERS.get(str(status).lower(), "")
+    block += f"   Status: {marker}{status}\n"
+    return block
+
+
+# Fields of an item result that are not shown as item fields
+_ITEM_SKIPPED_KEYS = frozenset({"id", "data", "found", "error"})
+
+
+def _field_text(value: Any) -> Any:
+    """Return a field value for display, nested values as compact JSON.
+
+    Compact JSON is cheaper to produce than repr and reads as JSON.
+    """
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value, default=str).decode()
+    return value
+
+
+@functools.lru_cache(maxsize=512)
+def _pretty_key(key: str) -> str:
+    """Turn a field name like ``created_at`` into ``Created At``."""
+    return key.replace("_", " ").title()
+
+
 def _format_item_result(result: dict, resource_type: str, item_id: str) -> str:
     """Format single item result for display."""
-    error = result.get("error")
-
-    if error:
-        return f"❌ Error getting {resource_type} {item_id}: {error}"
+    if failed := _error_text(result, f"getting {resource_type} {item_id}"):
+        return failed
 
     if not result.get("found", True):
         return f"📭 {resource_type} '{item_id}' not found"
@@ -1041,71 +1155,49 @@ def _format_item_result(result: dict, resource_type: str, item_id: str) -> str:
     output.append("")
 
     # Display key fields
-    for key, value in data.items():
-        if key not in ["id", "data", "found", "error"]:
-            formatted_key = key.replace("_", " ").title()
-            if isinstance(value, dict | list):
-                output.append(f"   {formatted_key}: {str(value)}")
-            else:
-                output.append(f"   {formatted_key}: {value}")
+    output.extend(
+        f"   {_pretty_key(key)}: {_field_text(value)}"
+        for key, value in data.items()
+        if key not in _ITEM_SKIPPED_KEYS
+    )
 
     return "\n".join(output)
 
 
-def _format_create_result(result: dict, resource_type: str, name: str) -> str:
-    """Format create result for display."""
-    success = result.get("success", False)
-    error = result.get("error")
+# Verb -> (present participle, past tense) for the write tools
+_WRITE_VERBS = {
+    "create": ("creating", "created"),
+    "update": ("updating", "updated"),
+    "delete": ("deleting", "deleted"),
+}
 
-    if error:
-        return f"❌ Error creating {resource_type} '{name}': {error}"
-
-    if success:
-        item_id = result.get("id", result.get("data", {}).get("id", "Unknown"))
-        return f"✅ Successfully created {resource_type} '{name}' (ID: {item_id})"
-    else:
-        message = result.get("message", "Unknown error")
-        return f"❌ Failed to create {resource_type} '{name}': {message}"
 
+def _format_write_result(result: dict, verb: str, subject: str) -> str:
+    """Format a create, update or delete result for display.
 
-def _format_update_result(result: dict, resource_type: str, item_id: str) -> str:
-    """Format update result for display."""
-    success = result.get("success", False)
-    error = result.get("error")
-
-    if error:
-        return f"❌ Error updating {resource_type} {item_id}: {error}"
+    ``subject`` names what was written, e.g. ``Feature Gate my_gate``.
+    """
+    doing, done = _WRITE_VERBS[verb]
+    if failed := _error_text(result, f"{doing} {subject}"):
+        return failed
 
-    if success:
-        return f"✅ Successfully updated {resource_type} {item_id}"
-    else:
+    if not result.get("success", False):
         message = result.get("message", "Unknown error")
-        return f"❌ Failed to update {resource_type} {item_id}: {message}"
-
-
-def _format_delete_result(result: dict, resource_type: str, item_id: str) -> str:
-    """Format delete result for display."""
-    success = result.get("success", False)
-    error = result.get("error")
-
-    if error:
-        return f"❌ Error deleting {resource_type} {item_id}: {error}"
+        return f"❌ Failed to {verb} {subject}: {message}"
 
-    if success:
-        return f"✅ Successfully deleted {resource_type} {item_id}"
-    else:
-        message = result.get("message", "Unknown error")
-        return f"❌ Failed to delete {resource_type} {item_id}: {message}"
+    text = f"✅ Successfully {done} {subject}"
+    if verb == "create":
+        item_id = result.get("id", result.get("data", {}).get("id", "Unknown"))
+        text += f" (ID: {item_id})"
+    return text
 
 
 def _format_audit_logs_result(result: dict) -> str:
     """Format audit logs result for display."""
-    error = result.get("error")
-
-    if error:
-        return f"❌ Error listing audit logs: {error}"
+    if failed := _error_text(result, "listing audit logs"):
+        return failed
 
-    logs = result.get("data", result.get("logs", []))
+    logs = _pick(result, "data", "logs", default=[])
     total = result.get("total", len(logs))
 
     output = [f"📜 Audit Logs ({total} found)"]
@@ -1115,27 +1207,22 @@ def _format_audit_logs_result(result: dict) -> str:
         return "\n".join(output)
 
     output.append("")
-    for log in logs:
-        timestamp = log.get("timestamp", log.get("createdAt", "Unknown"))
-        action = log.get("action", log.get("event", "Unknown"))
-        user = log.get("user", log.get("actor", "Unknown"))
-        target = log.get("target", log.get("resource", "Unknown"))
-
-        output.append(f"🔸 {timestamp}")
-        output.append(f"   Action: {action}")
-        output.append(f"   User: {user}")
-        output.append(f"   Target: {target}")
-        output.append("")
+    # One string per log entry, so the join sees a single element per row
+    output.extend(
+        f"🔸 {_pick(log, 'timestamp', 'createdAt')}\n"
+        f"   Action: {_pick(log, 'action', 'event')}\n"
+        f"   User: {_pick(log, 'user', 'actor')}\n"
+        f"   Target: {_pick(log, 'target', 'resource')}\n"
+        for log in logs
+    )
 
     return "\n".join(output)
 
 
 def _format_experiment_results(result: dict) -> str:
     """Format experiment results for display."""
-    error = result.get("error")
-    
-    if error:
-        return f"❌ Error getting experiment results: {error}"
+    if failed := _error_text(result, "getting experiment results"):
+        return failed
     
     data = result.get("data", {})
     experiment_id = data.get("experiment_id", "Unknown")
@@ -1150,34 +1237,17 @@ def _format_experiment_results(result: dict) -> str:
     primary_metrics = data.get("primary_metrics", [])
     if primary_metrics:
         output.append("🎯 Primary Metrics:")
-        for metric in primary_metrics:
-            name = metric.get("metric_name", "Unknown")
-            lift = metric.get("lift")
-            p_value = metric.get("p_value")
-            significance = metric.get("significance", "Unknown")
-            
-            output.append(f"   • {name}")
-            if lift is not None:
-                output.append(f"     Lift: {lift:.2%}")
-            if p_value is not None:
-                output.append(f"     P-value: {p_value:.4f}")
-            output.append(f"     Significance: {significance}")
-            output.append("")
+        output.extend(
+            _format_metric_summary(metric, True) for metric in primary_metrics
+        )
     
     # Secondary metrics
     secondary_metrics = data.get("secondary_metrics", [])
     if secondary_metrics:
         output.append("📈 Secondary Metrics:")
-        for metric in secondary_metrics:
-            name = metric.get("metric_name", "Unknown")
-            lift = metric.get("lift")
-            significance = metric.get("significance", "Unknown")
-            
-            output.append(f"   • {name}")
-            if lift is not None:
-                output.append(f"     Lift: {lift:.2%}")
-            output.append(f"     Significance: {significance}")
-            output.append("")
+        output.extend(
+            _format_metric_summary(metric, False) for metric in secondary_metrics
+        )
     
     # Overall recommendation
     recommendation = data.get("recommendation")
@@ -1187,12 +1257,24 @@ def _format_experiment_results(result: dict) -> str:
     return "\n".join(output)
 
 
+def _format_metric_summary(metric: dict, with_p_value: bool) -> str:
+    """Format one metric of an experiment result as a block of lines."""
+    lift = metric.get("lift")
+    p_value = metric.get("p_value") if with_p_value else None
+
+    block = f"   • {metric.get('metric_name', 'Unknown')}\n"
+    if lift is not None:
+        block += f"     Lift: {lift:.2%}\n"
+    if p_value is not None:
+        block += f"     P-value: {p_value:.4f}\n"
+    block += f"     Significance: {metric.get('significance', 'Unknown')}\n"
+    return block
+
+
 def _format_pulse_data(result: dict) -> str:
     """Format pulse data for display."""
-    error = result.get("error")
-    
-    if error:
-        return f"❌ Error getting pulse data: {error}"
+    if failed := _error_text(result, "getting pulse data"):
+        return failed
     
     data = result.get("data", {})
     experiment_id = data.get("experiment_id", "Unknown")
@@ -1217,36 +1299,33 @@ def _format_pulse_data(result: dict) -> str:
     indicators = data.get("performance_indicators", {})
     if indicators:
         output.append("📊 Performance Indicators:")
-        for key, value in indicators.items():
-            output.append(f"   • {key}: {value}")
+        output.extend(f"   • {key}: {value}" for key, value in indicators.items())
         output.append("")
     
     # Alerts
     alerts = data.get("alerts", [])
     if alerts:
         output.append("⚠️  Alerts:")
-        for alert in alerts:
-            alert_type = alert.get("type", "Unknown")
-            message = alert.get("message", "No details")
-            output.append(f"   • {alert_type}: {message}")
+        output.extend(
+            f"   • {alert.get('type', 'Unknown')}: "
+            f"{alert.get('message', 'No details')}"
+            for alert in alerts
+        )
         output.append("")
     
     # Recommendations
     recommendations = data.get("recommendations", [])
     if recommendations:
         output.append("💡 Recommendations:")
-        for rec in recommendations:
-            output.append(f"   • {rec}")
+        output.extend(f"   • {rec}" for rec in recommendations)
     
     return "\n".join(output)
 
 
 def _format_metric_details(result: dict) -> str:
     """Format metric details for display."""
-    error = result.get("error")
-    
-    if error:
-        return f"❌ Error getting metric details: {error}"
+    if failed := _error_text(result, "getting metric details"):
+        return failed
     
     data = result.get("data", {})
     metric_name = data.get("metric_name", "Unknown")
@@ -1303,10 +1382,8 @@ def _format_metric_details(result: dict) -> str:
 
 def _format_pulse_report(result: dict, format_type: str) -> str:
     """Format pulse report export for display."""
-    error = result.get("error")
-    
-    if error:
-        return f"❌ Error exporting pulse report: {error}"
+    if failed := _error_text(result, "exporting pulse report"):
+        return failed
     
     data = result.get("data", {})
     
@@ -2,12 +2,20 @@
 Tests for the Statsig MCP server.
 """
 
+import asyncio
+import json
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from mcp import types
+from mcp.shared.message import SessionMessage
 
-from statsig_mcp.console_client import StatsigConsoleClient
+from statsig_mcp import _stdio, _tool_cache, server
+from statsig_mcp._inprocess import InProcessSession
+from statsig_mcp._stdio import buffered_stdio_server
+from statsig_mcp.console_client import StatsigConsoleClient, close_client, get_client
 
 
 @pytest.fixture
@@ -75,6 +83,71 @@ class TestStatsigConsoleClient:
                 assert client._initialized is False
                 mock_client.aclose.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_clients_share_http_client(self):
+        """Test that clients with the same key share one HTTP client."""
+        with patch.dict(os.environ, {"STATSIG_CONSOLE_API_KEY": "console-test-key"}):
+            mock_client = AsyncMock()
+
+            with patch("httpx.AsyncClient", return_value=mock_client) as factory:
+                first, second = StatsigConsoleClient(), StatsigConsoleClient()
+                await first.initialize()
+                await second.initialize()
+                assert factory.call_count == 1
+                assert first._client is second._client
+
+                await first.shutdown()
+                mock_client.aclose.assert_not_called()
+                await second.shutdown()
+                mock_client.aclose.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_pool_limits_are_configurable(self):
+        """Test that pool sizes reach the transport and key the shared client."""
+        with patch.dict(os.environ, {"STATSIG_CONSOLE_API_KEY": "console-test-key"}):
+            client = StatsigConsoleClient(
+                max_connections=50, max_keepalive_connections=25
+            )
+            other = StatsigConsoleClient()
+            with patch(
+                "httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport
+            ) as transport:
+                await client.initialize()
+                await other.initialize()
+            limits = transport.call_args_list[0].kwargs["limits"]
+            assert (limits.max_connections, limits.max_keepalive_connections) == (
+                50,
+                25,
+            )
+            assert client._client is not other._client
+            await client.shutdown()
+            await other.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_get_client_is_a_singleton(self):
+        """Test that get_client() hands out one client until close_client()."""
+        with patch.dict(os.environ, {"STATSIG_CONSOLE_API_KEY": "console-test-key"}):
+            first = await get_client()
+            assert await get_client() is first
+            assert first._initialized
+
+            await close_client()
+            assert not first._initialized
+            second = await get_client()
+            assert second is not first
+            await close_client()
+
+    @pytest.mark.asyncio
+    async def test_api_key_can_be_passed_directly(self):
+        """Test that an explicit API key needs no environment variable."""
+        with patch.dict(os.environ, {}, clear=True):
+            await server.initialize_client({"api_key": "console-direct-key"})
+            try:
+                assert server.statsig_client._console_api_key == "console-direct-key"
+                assert "STATSIG_CONSOLE_API_KEY" not in os.environ
+            finally:
+                await server.cleanup()
+
     def test_environment_variables(self):
         """Test that environment variables are properly handled."""
         with patch.dict(os.environ, {"STATSIG_CONSOLE_API_KEY": "test-console-key"}):
@@ -92,5 +165,540 @@ class TestStatsigConsoleClient:
         assert client._api_version == "20240601"
 
 
+def _mock_console_client(handler):
+    """Build an initialized console client that answers requests with ``handler``."""
+    client = StatsigConsoleClient()
+    client._client = httpx.AsyncClient(
+        base_url=client._base_url, transport=httpx.MockTransport(handler)
+    )
+    client._initialized = True
+    return client
+
+
+class TestResponseCache:
+    """Test caching of Console API read requests."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_reads_are_cached(self):
+        """Test that repeated and concurrent reads share one request."""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            return httpx.Response(200, json={"data": [{"id": "gate_a"}]})
+
+        client = _mock_console_client(handler)
+        results = await asyncio.gather(*(client.list_gates() for _ in range(5)))
+        await client.list_gates()
+
+        assert requests == ["/console/v1/gates"]
+        assert all(result == {"data": [{"id": "gate_a"}]} for result in results)
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_uncached_reads_share_in_flight_requests(self):
+        """Test that concurrent uncached reads share one request but aren't kept."""
+        requests = []
+
+        async def handler(request):
+            requests.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"status": "ok"})
+
+        client = _mock_console_client(handler)
+        results = await asyncio.gather(
+            *(client.get_experiment_pulse("exp_a") for _ in range(3))
+        )
+        await client.get_experiment_pulse("exp_a")
+
+        assert requests == ["/console/v1/experiments/exp_a/pulse"] * 2
+        assert all(result["success"] for result in results)
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates_and_404_is_not_cached(self):
+        """Test that writes drop cached reads and missing items are refetched."""
+        requests = []
+
+        def handler(request):
+            requests.append((request.method, request.url.path))
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404)
+            return httpx.Response(200, json={"data": []})
+
+        client = _mock_console_client(handler)
+        await client.list_gates()
+        await client.update_gate("gate_a", {"is_enabled": True})
+        await client.list_gates()
+        assert (await client.get_gate("missing"))["found"] is False
+        assert (await client.get_gate("missing"))["found"] is False
+        assert await client.delete_gate("missing") == {
+            "success": False,
+            "found": False,
+            "error": "Gate 'missing' not found",
+        }
+
+        assert requests == [
+            ("GET", "/console/v1/gates"),
+            ("PATCH", "/console/v1/gates/gate_a"),
+            ("GET", "/console/v1/gates"),
+            ("GET", "/console/v1/gates/missing"),
+            ("GET", "/console/v1/gates/missing"),
+            ("DELETE", "/console/v1/gates/missing"),
+        ]
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_bulk_gate_updates(self):
+        """Test that bulk updates PATCH every gate with API field names."""
+        bodies = {}
+
+        def handler(request):
+            bodies[request.url.path] = request.content
+            return httpx.Response(204)
+
+        client = _mock_console_client(handler)
+        results = await client.update_gates(
+            {"a": {"is_enabled": True}, "b": {"description": "x", "bogus": 1}},
+            concurrency=1,
+        )
+
+        assert results == {"a": {"success": True}, "b": {"success": True}}
+        assert bodies == {
+            "/console/v1/gates/a": b'{"isEnabled":true}',
+            "/console/v1/gates/b": b'{"description":"x"}',
+        }
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded_and_invalidatable(self):
+        """Test LRU eviction and explicit invalidation of cached reads."""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            return httpx.Response(200, json={})
+
+        with patch.dict(os.environ, {"STATSIG_CACHE_MAX_ENTRIES": "2"}):
+            client = _mock_console_client(handler)
+        await client.get_gate("a")
+        await client.get_gate("b")
+        await client.get_gate("a")
+        await client.get_gate("c")  # evicts b, the least recently used
+        await client.get_gate("a")
+        await client.get_gate("b")
+        assert requests == [f"/console/v1/gates/{g}" for g in "abcb"]
+
+        client.invalidate("/console/v1/gates")
+        await client.get_gate("b")
+        assert requests[-1] == "/console/v1/gates/b" and len(requests) == 5
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than STATSIG_MAX_CONCURRENCY requests run at once."""
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        with patch.dict(os.environ, {"STATSIG_MAX_CONCURRENCY": "3"}):
+            client = _mock_console_client(handler)
+        gate_ids = [f"gate_{i}" for i in range(10)]
+        gates = await client.get_gates(gate_ids)
+
+        assert list(gates) == gate_ids
+        assert peak == 3
+
+        peak = 0
+        await client.get_metrics(gate_ids, concurrency=2)
+        assert peak == 2
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidates_with_etag(self):
+        """Test that a stale entry is refreshed with a conditional GET."""
+        conditional = []
+
+        def handler(request):
+            conditional.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"data": []}, headers={"ETag": '"v1"'})
+
+        client = _mock_console_client(handler)
+        first = await client.list_gates()
+
+        # Age the entry past its fresh TTL but keep it within the stale TTL
+        key = "/console/v1/gates"
+        _, stale_until, payload, validators = client._cache._entries[key]
+        client._cache._entries[key] = (0, stale_until, payload, validators)
+
+        assert await client.list_gates() is first
+        await client._cache.inflight(key)
+
+        assert conditional == [None, '"v1"']
+        assert client._cache.lookup(key) == (first, True)
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_errors_and_expired_fallback(self):
+        """Test HTTP errors become results and expired entries cover outages."""
+        # Server errors are retried, so the 503 has to outlast the retries
+        unavailable = httpx.Response(
+            503, text="unavailable", headers={"Retry-After": "0"}
+        )
+        responses = [
+            httpx.Response(200, json={"data": []}),
+            httpx.ConnectError("connection refused"),
+            *[unavailable] * 4,
+        ]
+
+        def handler(request):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        client = _mock_console_client(handler)
+        first = await client.list_gates()
+
+        # Expire the entry entirely
+        key = "/console/v1/gates"
+        client._cache._entries[key] = (0, 0, *client._cache._entries[key][2:])
+
+        assert await client.list_gates() is first
+        assert await client.list_gates() == {"error": "HTTP 503: unavailable"}
+        assert responses == []
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_requests_are_retried(self):
+        """Test that 429s are retried after Retry-After and 5xx writes are not."""
+        calls = []
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(201, json={"id": "gate_a"}),
+            httpx.Response(500, text="boom"),
+        ]
+
+        def handler(request):
+            calls.append(request.method)
+            return responses.pop(0)
+
+        client = _mock_console_client(handler)
+        assert (await client.create_gate("gate_a"))["success"] is True
+        assert (await client.delete_gate("gate_a"))["error"] == "HTTP 500: boom"
+        assert calls == ["POST", "POST", "DELETE"]
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_query_events_reads_only_limit(self):
+        """Test that listing events returns only the requested number."""
+        events = [{"name": f"event_{i}"} for i in range(50)]
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"data": events}),
+        ]
+
+        def handler(request):
+            return responses.pop(0)
+
+        client = _mock_console_client(handler)
+        # Rate limited first; a float limit is what the number schema allows
+        result = await client.query_events(limit=3.0)
+
+        assert result["event_types"] == events[:3]
+        assert result["total_found"] == 3
+        assert responses == []
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_repeated_network_errors(self):
+        """Test that repeated network errors stop requests being sent."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request.url.path)
+            raise httpx.ConnectError("connection refused")
+
+        client = _mock_console_client(handler)
+        for i in range(5):
+            assert "error" in await client.get_gate(f"gate_{i}")
+        result = await client.get_gate("gate_5")
+
+        assert len(attempts) == 5
+        assert "unavailable" in result["error"]
+        await client.shutdown()
+
+
+class TestToolCache:
+    """Test the on-disk tool catalog cache."""
+
+    def test_round_trip(self, tmp_path, monkeypatch):
+        """Test that a saved catalog is loaded back under the same key."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        key = _tool_cache.tool_cache_key("python", ["-m", "statsig_mcp"], {"A": "1"})
+        tools = [{"name": "list_gates", "inputSchema": {"type": "object"}}]
+
+        assert _tool_cache.load_cached_tools(key) is None
+        _tool_cache.save_cached_tools(key, tools)
+        assert _tool_cache.load_cached_tools(key) == tools
+
+    def test_key_depends_on_launch_config(self):
+        """Test that the key changes with the command line and environment."""
+        base = _tool_cache.tool_cache_key("python", ["-m", "statsig_mcp"], {"A": "1"})
+
+        assert base == _tool_cache.tool_cache_key(
+            "python", ["-m", "statsig_mcp"], {"A": "1"}
+        )
+        assert base != _tool_cache.tool_cache_key("python", ["-m", "other"], {"A": "1"})
+        assert base != _tool_cache.tool_cache_key(
+            "python", ["-m", "statsig_mcp"], {"A": "2"}
+        )
+
+
+class TestServerHandlers:
+    """Test the MCP request handlers registered by the server."""
+
+    @pytest.mark.asyncio
+    async def test_list_tools_returns_prebuilt_catalog(self):
+        """Test that tools/list serves the same prebuilt Tool models."""
+        handler = server.server.request_handlers[types.ListToolsRequest]
+        result = await handler(types.ListToolsRequest(method="tools/list"))
+
+        assert result.root.tools[0].name == "list_gates"
+        assert "required" not in result.root.tools[0].inputSchema
+        assert await server.list_tools() is await server.list_tools()
+
+    @pytest.mark.asyncio
+    async def test_every_tool_has_a_handler_and_reuse_policy(self):
+        """Test that each listed tool is dispatchable with a known policy."""
+        names = {tool.name for tool in await server.list_tools()}
+
+        assert names == set(server._TOOL_HANDLERS)
+        for tool in server._TOOL_HANDLERS.values():
+            assert tool.reuse in ("cache", "share", "write")
+
+    @pytest.mark.asyncio
+    async def test_call_tool_dispatches_by_name(self):
+        """Test that tool calls reach their handler and failures become text."""
+        client = AsyncMock()
+        client.update_gate.return_value = {"success": True}
+        client.get_gate.side_effect = RuntimeError("boom")
+
+        with patch.object(server, "statsig_client", client):
+            updated = await server.call_tool(
+                "update_gate", {"gate_id": "g", "is_enabled": True}
+            )
+            failed = await server.call_tool("get_gate", {"gate_id": "g"})
+
+        client.update_gate.assert_awaited_once_with("g", {"is_enabled": True})
+        assert updated[0].text == "✅ Successfully updated Feature Gate g"
+        assert failed[0].text == "Error calling tool get_gate: boom"
+
+    def test_cpu_pinning_is_opt_in(self):
+        """Test that STATSIG_MCP_CPU pins the process and is off by default."""
+        with patch.object(server.os, "sched_setaffinity", create=True) as pin:
+            with patch.dict(os.environ, {}, clear=True):
+                assert server.pin_cpu() is None
+            with patch.dict(os.environ, {"STATSIG_MCP_CPU": "x"}):
+                assert server.pin_cpu() is None
+            with patch.dict(os.environ, {"STATSIG_MCP_CPU": "3"}):
+                assert server.pin_cpu() == 3
+
+        pin.assert_called_once_with(0, {3})
+
+    def test_nested_values_render_as_compact_json(self):
+        """Test that dict and list fields are shown as compact JSON."""
+        text = server._format_item_result(
+            {"id": "g", "rules": [{"name": "r", "passPercentage": 50}]},
+            "Feature Gate",
+            "g",
+        )
+
+        assert '   Rules: [{"name":"r","passPercentage":50}]' in text
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_are_rejected_before_dispatch(self):
+        """Test that arguments are checked against the tool's input schema."""
+        client = AsyncMock()
+
+        with patch.object(server, "statsig_client", client):
+            missing = await server.call_tool("get_gate", {})
+            wrong_type = await server.call_tool("list_gates", {"limit": "ten"})
+
+        assert missing.isError
+        assert missing.content[0].text == (
+            "Input validation error: 'gate_id' is a required property"
+        )
+        assert wrong_type.isError
+        assert wrong_type.content[0].text.startswith("Input validation error: 'ten'")
+        client.get_gate.assert_not_called()
+        client.list_gates.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_reads_share_one_call(self):
+        """Test that identical read-only tool calls in flight are coalesced."""
+        release = asyncio.Event()
+
+        async def list_gates(limit):
+            await release.wait()
+            return {"data": []}
+
+        client = AsyncMock()
+        client.list_gates.side_effect = list_gates
+
+        with patch.object(server, "statsig_client", client):
+            calls = [
+                asyncio.create_task(server.call_tool("list_gates", {"limit": 5}))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*calls)
+
+        assert client.list_gates.await_count == 1
+        assert results[0] == results[1] == results[2]
+        assert server._tool_calls.inflight(("list_gates", b'{"limit":5}')) is None
+        server._tool_calls.clear()
+
+    @pytest.mark.asyncio
+    async def test_read_results_are_cached_until_a_write(self):
+        """Test that successful reads are reused and writes clear them."""
+        client = AsyncMock()
+        client.get_metric.return_value = {"id": "m", "name": "Metric"}
+        client.create_segment.return_value = {"success": True}
+
+        with patch.object(server, "statsig_client", client):
+            first = await server.call_tool("get_metric", {"metric_id": "m"})
+            assert await server.call_tool("get_metric", {"metric_id": "m"}) is first
+            assert client.get_metric.await_count == 1
+
+            await server.call_tool("create_segment", {"name": "s"})
+            await server.call_tool("get_metric", {"metric_id": "m"})
+            assert client.get_metric.await_count == 2
+
+            client.get_metric.return_value = {"error": "HTTP 500: boom"}
+            server._tool_calls.clear()
+            await server.call_tool("get_metric", {"metric_id": "m"})
+            await server.call_tool("get_metric", {"metric_id": "m"})
+            assert client.get_metric.await_count == 4
+        server._tool_calls.clear()
+
+    @pytest.mark.asyncio
+    async def test_analytics_results_are_not_cached(self):
+        """Test that tools the client fetches uncached are re-run every time."""
+        client = AsyncMock()
+        client.get_experiment_pulse.return_value = {"experiment_id": "e"}
+
+        with patch.object(server, "statsig_client", client):
+            arguments = {"experiment_id": "e"}
+            await server.call_tool("get_experiment_pulse", arguments)
+            await server.call_tool("get_experiment_pulse", arguments)
+            assert client.get_experiment_pulse.await_count == 2
+        server._tool_calls.clear()
+
+    @pytest.mark.asyncio
+    async def test_client_invalidate_drops_tool_results(self):
+        """Test that invalidating the client also drops cached tool results."""
+        client = StatsigConsoleClient(api_key="test-key")
+        key = ("get_gate", b'{"gate_id":"g"}')
+
+        with (
+            patch.object(server, "get_client", AsyncMock(return_value=client)),
+            patch.object(server, "statsig_client", None),
+        ):
+            await server.initialize_client({"api_key": "test-key"})
+            content = [types.TextContent(type="text", text="gate")]
+            server._tool_calls.store(key, content, server._tool_calls.generation)
+            assert server._tool_calls.lookup(key) is content
+
+            client.invalidate("/console/v1/gates")
+        assert server._tool_calls.lookup(key) is None
+
+
+class TestBufferedStdio:
+    """Test the buffered stdio transport."""
+
+    @pytest.mark.asyncio
+    async def test_reads_batched_lines_and_writes_responses(self):
+        """Test that several lines in one read all arrive and replies are framed."""
+        in_read, in_write = os.pipe()
+        out_read, out_write = os.pipe()
+        os.write(
+            in_write,
+            b'{"jsonrpc": "2.0", "id": 1, "method": "ping"}\n'
+            b"not json\n"
+            b'{"jsonrpc": "2.0", "id": 2, "method": "ping"}',
+        )
+        os.close(in_write)
+
+        async with buffered_stdio_server(in_read, out_write) as (reader, writer):
+            received = [item async for item in reader]
+            await writer.send(received[0])
+            await writer.aclose()
+
+        assert [type(item).__name__ for item in received] == [
+            "SessionMessage",
+            "ValidationError",
+            "SessionMessage",
+        ]
+        assert received[2].message.root.id == 2
+        line = os.read(out_read, 1024)
+        assert line.endswith(b"\n") and line.count(b"\n") == 1
+        assert json.loads(line) == {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+        for fd in (in_read, out_read, out_write):
+            os.close(fd)
+
+    @pytest.mark.asyncio
+    async def test_waiting_replies_share_one_write(self):
+        """Test that replies queued while a write is in flight are coalesced."""
+        in_read, in_write = os.pipe()
+        out_read, out_write = os.pipe()
+        os.close(in_write)
+        ping = SessionMessage(
+            types.JSONRPCMessage.model_validate(
+                {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+            )
+        )
+
+        with patch.object(_stdio, "_write_all", wraps=_stdio._write_all) as write_all:
+            async with buffered_stdio_server(in_read, out_write) as (_, writer):
+                await asyncio.gather(*(writer.send(ping) for _ in range(4)))
+                await writer.aclose()
+
+        output = os.read(out_read, 4096)
+        assert output.count(b"\n") == 4
+        assert write_all.call_count < 4
+        for fd in (in_read, out_read, out_write):
+            os.close(fd)
+
+
+class TestInProcessSession:
+    """Test calling the server's tools in-process."""
+
+    @pytest.mark.asyncio
+    async def test_call_tool_without_subprocess(self):
+        """Test that tools are dispatched directly and wrapped like ClientSession."""
+        async with InProcessSession(api_key="console-test-key") as session:
+            tools = await session.list_tools()
+            assert any(tool.name == "list_gates" for tool in tools)
+
+            result = await session.call_tool("no_such_tool", {})
+            assert result.content[0].text == "Unknown tool: no_such_tool"
+
+    @pytest.mark.asyncio
+    async def test_requires_connect(self):
+        """Test that calling a tool before connect() fails."""
+        with pytest.raises(RuntimeError, match="not connected"):
+            await InProcessSession(api_key="console-test-key").call_tool("list_gates")
+
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file